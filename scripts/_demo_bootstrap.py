@@ -0,0 +1,24 @@
+"""Shared path setup for the ReasonOS demo scripts.
+
+Importing this module puts the repository's src directory on sys.path
+and exposes the repository paths every demo needs. Kernel modules are
+not imported here so that each script only pays for what it uses.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+SRC_DIR = REPO_ROOT / "src"
+DATA_DIR = REPO_ROOT / "data"
+RUNS_DIR = REPO_ROOT / "runs"
+SCHEMA_PATH = REPO_ROOT / "specs" / "rsl" / "rsl.schema.json"
+DOC_PATH = DATA_DIR / "demo_paper.txt"
+
+# Prefix stripped from absolute paths when printing them repo-relative
+REPO_PREFIX = str(REPO_ROOT) + os.sep
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,23 @@
+"""JSON output helpers shared by the ReasonOS demo scripts.
+
+The encoding itself, including the orjson fallback, lives in
+reasonos.utils.json_bytes.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import _demo_bootstrap  # noqa: F401  (puts src on sys.path)
+from reasonos.utils.json_bytes import dump_pretty
+
+
+def dump_rsl(obj: dict[str, Any], path: Path) -> None:
+    """
+    Write an RSL document to disk as indented JSON.
+
+    Args:
+        obj: The RSL document dictionary to write.
+        path: Destination file path.
+    """
+    with open(path, "wb") as f:
+        dump_pretty(obj, f)
@@ -8,93 +8,88 @@ Demonstrates:
 3. Scenario C: Policy blocked (High risk, zero confidence)
 """
 
-import json
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append("src")
-
+from _demo_bootstrap import DOC_PATH, RUNS_DIR, SCHEMA_PATH
 from reasonos.kernel import run_paper_verification_task
+from reasonos.rsl_view import typed_view
+from reasonos.utils.doc_cache import load_document
+from reasonos.utils.time import compact_utc_stamp
 from reasonos.utils.validate import validate_rsl
-from reasonos.utils.time import now_iso
+from _json_io import dump_rsl
 
 def save_run(rsl, name, runs_dir):
-    timestamp = now_iso().replace(":", "").replace("-", "").split(".")[0]
+    timestamp = compact_utc_stamp()
     output_file = runs_dir / f"run_{timestamp}_{name}.json"
-    with open(output_file, "w") as f:
-        json.dump(rsl, f, indent=2)
+    dump_rsl(rsl, output_file)
     return output_file
 
 def print_accounting(scenario_name, rsl):
     print(f"\n{scenario_name}")
-    acc = rsl.get("accounting", {})
-    if not acc:
+    view = typed_view(rsl)
+    acc = view.accounting
+    if acc is None:
         print("ERROR: No accounting object found!")
         return
 
-    print(f"Total cost: {acc.get('total_cost')}")
-    print(f"Total risk: {acc.get('total_risk')}")
+    print(f"Total cost: {acc.total_cost}")
+    print(f"Total risk: {acc.total_risk}")
     
-    adjustments = acc.get("confidence_adjustments", [])
-    if adjustments:
+    if acc.confidence_adjustments:
         print("Confidence adjustments:")
-        for adj in adjustments:
-            print(f"- {adj['source']}: {adj['delta']}")
+        for adj in acc.confidence_adjustments:
+            print(f"- {adj.source}: {adj.delta}")
             
-    print(f"Final confidence: {acc.get('final_confidence')}")
+    print(f"Final confidence: {acc.final_confidence}")
     
     # Verify final confidence matches
-    if rsl["final_conclusion"]["confidence"] != acc.get("final_confidence"):
-        print(f"WARNING: Mismatch! Conclusion confidence {rsl['final_conclusion']['confidence']} != Accounting {acc.get('final_confidence')}")
+    if view.conclusion_confidence != acc.final_confidence:
+        print(f"WARNING: Mismatch! Conclusion confidence {view.conclusion_confidence} != Accounting {acc.final_confidence}")
 
 def main():
     print("=== ReasonOS Accounting Demo ===")
     
     # Setup paths
-    base_dir = Path(__file__).parent.parent
-    data_dir = base_dir / "data"
-    runs_dir = base_dir / "runs"
+    runs_dir = RUNS_DIR
     runs_dir.mkdir(exist_ok=True)
-    schema_path = str(base_dir / "specs/rsl/rsl.schema.json")
-    
-    document_path = str(data_dir / "demo_paper.txt")
+    schema_path = str(SCHEMA_PATH)
+    document_path = str(DOC_PATH)
+    document = load_document(document_path)
     
-    # === Scenario A: Clean verification ===
-    # Claim: "Model X improves accuracy by 15 percent on Dataset Y."
-    # Expect moderate cost, low risk, confidence ~0.65 (due to partial support / scope)
-    rsl_a = run_paper_verification_task(
-        paragraph="Model X improves accuracy by 15 percent on Dataset Y.",
-        document_path=document_path,
-        policy_path="policies/default_policy.json"
-    )
-    save_run(rsl_a, "accounting_scenario_a", runs_dir)
-    print_accounting("Scenario A", rsl_a)
-    validate_rsl(rsl_a, schema_path)
-
-    # === Scenario B: Revision triggered ===
-    # Claim: "Model X improves accuracy by 20 percent on Dataset Y."
-    # Expect higher cost, higher risk, confidence ~0.85 after revision penalties
-    rsl_b = run_paper_verification_task(
-        paragraph="Model X improves accuracy by 20 percent on Dataset Y.",
-        document_path=document_path,
-        policy_path="policies/default_policy.json"
-    )
-    save_run(rsl_b, "accounting_scenario_b", runs_dir)
-    print_accounting("Scenario B", rsl_b)
-    validate_rsl(rsl_b, schema_path)
-
-    # === Scenario C: Policy blocked ===
-    # Claim: "Model X improves accuracy by 60 percent on Dataset Y."
-    # Expect high risk (1.0), confidence 0.0
-    rsl_c = run_paper_verification_task(
-        paragraph="Model X improves accuracy by 60 percent on Dataset Y.",
-        document_path=document_path,
-        policy_path="policies/demo_policy.json"
-    )
-    save_run(rsl_c, "accounting_scenario_c", runs_dir)
-    print_accounting("Scenario C", rsl_c)
-    validate_rsl(rsl_c, schema_path)
+    scenarios = [
+        # === Scenario A: Clean verification ===
+        # Expect moderate cost, low risk, confidence ~0.65 (due to partial support / scope)
+        (
+            "Scenario A",
+            "accounting_scenario_a",
+            "Model X improves accuracy by 15 percent on Dataset Y.",
+            "policies/default_policy.json",
+        ),
+        # === Scenario B: Revision triggered ===
+        # Expect higher cost, higher risk, confidence ~0.85 after revision penalties
+        (
+            "Scenario B",
+            "accounting_scenario_b",
+            "Model X improves accuracy by 20 percent on Dataset Y.",
+            "policies/default_policy.json",
+        ),
+        # === Scenario C: Policy blocked ===
+        # Expect high risk (1.0), confidence 0.0
+        (
+            "Scenario C",
+            "accounting_scenario_c",
+            "Model X improves accuracy by 60 percent on Dataset Y.",
+            "policies/demo_policy.json",
+        ),
+    ]
+    for label, name, paragraph, policy_path in scenarios:
+        rsl = run_paper_verification_task(
+            paragraph=paragraph,
+            document_path=document_path,
+            policy_path=policy_path,
+            document=document
+        )
+        save_run(rsl, name, runs_dir)
+        print_accounting(label, rsl)
+        validate_rsl(rsl, schema_path)
 
 if __name__ == "__main__":
     main()
@@ -14,20 +14,16 @@ Usage:
 This script must be run from the repository root directory.
 """
 
-import json
 import sys
+import traceback
 from datetime import datetime, timezone
-from pathlib import Path
-
-# Add src to path for imports
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parent
-SRC_DIR = REPO_ROOT / "src"
-sys.path.insert(0, str(SRC_DIR))
 
+from _demo_bootstrap import DATA_DIR, DOC_PATH, REPO_PREFIX, RUNS_DIR, SCHEMA_PATH
 from reasonos.kernel import run_paper_verification_task
+from reasonos.utils.doc_cache import load_document
 from reasonos.utils.validate import validate_rsl
-from reasonos.storage.memory_store import clear_memory
+from reasonos.storage.memory_store import clear_memory, open_memory_session
+from _json_io import dump_rsl
 
 
 def main() -> int:
@@ -38,10 +34,10 @@ def main() -> int:
         0 on success, 1 on error.
     """
     # Define paths
-    schema_path = REPO_ROOT / "specs" / "rsl" / "rsl.schema.json"
-    runs_dir = REPO_ROOT / "runs"
-    document_path = REPO_ROOT / "data" / "demo_paper.txt"
-    memory_path = REPO_ROOT / "data" / "memory.json"
+    schema_path = SCHEMA_PATH
+    runs_dir = RUNS_DIR
+    document_path = DOC_PATH
+    memory_path = DATA_DIR / "memory.json"
 
     # Ensure runs directory exists
     runs_dir.mkdir(parents=True, exist_ok=True)
@@ -50,70 +46,77 @@ def main() -> int:
     clear_memory(str(memory_path))
 
     try:
-        # === Run 1: First claim ===
-        paragraph_1 = "Model X improves accuracy by 15 percent on Dataset Y."
-
-        print("=== Run 1 ===")
-        rsl_doc_1 = run_paper_verification_task(
-            paragraph=paragraph_1,
-            document_path=str(document_path),
-            memory_path=str(memory_path),
-        )
-
-        # Validate against schema
-        validate_rsl(rsl_doc_1, str(schema_path))
-
-        # Generate output filename
-        timestamp_1 = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
-        output_file_1 = runs_dir / f"run_{timestamp_1}_memory_demo_1.json"
-
-        # Write to file
-        with open(output_file_1, "w", encoding="utf-8") as f:
-            json.dump(rsl_doc_1, f, indent=2)
-
-        # Print results
-        print(output_file_1.relative_to(REPO_ROOT))
-        print("Schema validation passed")
-        print(f"Memory file updated: {memory_path.relative_to(REPO_ROOT)}")
-        print()
-
-        # === Run 2: Conflicting claim ===
-        paragraph_2 = "Model X improves accuracy by 20 percent on Dataset Y."
-
-        print("=== Run 2 ===")
-        rsl_doc_2 = run_paper_verification_task(
-            paragraph=paragraph_2,
-            document_path=str(document_path),
-            memory_path=str(memory_path),
-        )
-
-        # Validate against schema
-        validate_rsl(rsl_doc_2, str(schema_path))
-
-        # Generate output filename
-        timestamp_2 = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
-        output_file_2 = runs_dir / f"run_{timestamp_2}_memory_demo_2.json"
-
-        # Write to file
-        with open(output_file_2, "w", encoding="utf-8") as f:
-            json.dump(rsl_doc_2, f, indent=2)
-
-        # Print results
-        print(output_file_2.relative_to(REPO_ROOT))
-        print("Schema validation passed")
-
-        # Check for contradictions
-        if rsl_doc_2.get("contradictions"):
-            print("Contradiction detected!")
-            for c in rsl_doc_2["contradictions"]:
-                print(f"  Severity: {c['severity']}")
-                print(f"  Description: {c['description']}")
-        else:
-            print("No contradictions detected")
-
+        document = load_document(str(document_path))
+
+        # Buffer memory across both runs and write it back once
+        with open_memory_session(str(memory_path)):
+            # === Run 1: First claim ===
+            paragraph_1 = "Model X improves accuracy by 15 percent on Dataset Y."
+
+            print("=== Run 1 ===")
+            rsl_doc_1 = run_paper_verification_task(
+                paragraph=paragraph_1,
+                document_path=str(document_path),
+                memory_path=str(memory_path),
+                document=document,
+            )
+
+            # Validate against schema
+            validate_rsl(rsl_doc_1, str(schema_path))
+
+            # Generate output filename
+            timestamp_1 = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
+            output_file_1 = runs_dir / f"run_{timestamp_1}_memory_demo_1.json"
+
+            # Write to file
+            dump_rsl(rsl_doc_1, output_file_1)
+
+            # Print results
+            print(str(output_file_1).removeprefix(REPO_PREFIX))
+            print("Schema validation passed")
+            print()
+
+            # === Run 2: Conflicting claim ===
+            paragraph_2 = "Model X improves accuracy by 20 percent on Dataset Y."
+
+            print("=== Run 2 ===")
+            rsl_doc_2 = run_paper_verification_task(
+                paragraph=paragraph_2,
+                document_path=str(document_path),
+                memory_path=str(memory_path),
+                document=document,
+            )
+
+            # Validate against schema
+            validate_rsl(rsl_doc_2, str(schema_path))
+
+            # Generate output filename
+            timestamp_2 = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
+            output_file_2 = runs_dir / f"run_{timestamp_2}_memory_demo_2.json"
+
+            # Write to file
+            dump_rsl(rsl_doc_2, output_file_2)
+
+            # Print results
+            print(str(output_file_2).removeprefix(REPO_PREFIX))
+            print("Schema validation passed")
+
+            # Check for contradictions
+            if rsl_doc_2.get("contradictions"):
+                print("Contradiction detected!")
+                for c in rsl_doc_2["contradictions"]:
+                    print(f"  Severity: {c['severity']}")
+                    print(f"  Description: {c['description']}")
+            else:
+                print("No contradictions detected")
+
+            print()
+            print("Final conclusion:")
+            print(rsl_doc_2["final_conclusion"]["content"])
+
+        # The session writes the buffered memory back when the block exits
         print()
-        print("Final conclusion:")
-        print(rsl_doc_2["final_conclusion"]["content"])
+        print(f"Memory file updated: {str(memory_path).removeprefix(REPO_PREFIX)}")
 
         return 0
 
@@ -122,7 +125,6 @@ def main() -> int:
         return 1
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
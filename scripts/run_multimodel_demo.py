@@ -6,29 +6,24 @@ Demonstrates routing steps to different executors (GPT, O3, Retriever)
 based on policy rules.
 """
 
-import json
-import sys
-from pathlib import Path
+import traceback
 
-# Add src to path
-sys.path.append("src")
-
-from reasonos.kernel import run_paper_verification_task
-from reasonos.utils.validate import validate_rsl
-from reasonos.utils.ids import new_run_id
-from reasonos.utils.time import now_iso
+from _demo_bootstrap import DOC_PATH, RUNS_DIR, SCHEMA_PATH
+from reasonos.utils.time import compact_utc_stamp
+from _json_io import dump_rsl
 
 def main():
+    from reasonos.kernel import run_paper_verification_task
+    from reasonos.rsl_view import typed_view
+    from reasonos.utils.validate import validate_rsl
+
     print("=== ReasonOS Multi-Model Demo ===")
     
     # Setup paths
-    base_dir = Path(__file__).parent.parent
-    data_dir = base_dir / "data"
-    runs_dir = base_dir / "runs"
+    runs_dir = RUNS_DIR
     runs_dir.mkdir(exist_ok=True)
-    schema_path = str(base_dir / "specs/rsl/rsl.schema.json")
-    
-    document_path = str(data_dir / "demo_paper.txt")
+    schema_path = str(SCHEMA_PATH)
+    document_path = str(DOC_PATH)
     
     # Scenario: Claim supported by document
     paragraph = "Model X improves accuracy by 15 percent on Dataset Y."
@@ -56,36 +51,26 @@ def main():
         
         # Save run output
         run_id = rsl["run"]["run_id"]
-        timestamp = now_iso().replace(":", "").replace("-", "").split(".")[0]
+        timestamp = compact_utc_stamp()
         output_file = runs_dir / f"run_{timestamp}_multimodel_demo.json"
         
-        with open(output_file, "w") as f:
-            json.dump(rsl, f, indent=2)
+        dump_rsl(rsl, output_file)
             
         print(f"\nRun completed. Output saved to: {output_file}")
         
         # Check executors
-        steps = rsl["steps"]
+        view = typed_view(rsl)
         print("\nExecutor Usage:")
-        for step in steps:
-            step_id = step.get("step_id")
-            step_index = step.get("step_index")
-            executor = step.get("executor", {})
-            executor_name = executor.get("name", "unknown")
-            
-            # Also check execution metadata
-            execution = step.get("execution", {})
-            executor_used = execution.get("executor_used", "unknown")
-            
-            print(f"S{step_index + 1} executor: {executor_name} (Used: {executor_used})")
+        for step in view.steps:
+            # executor.used comes from the step's execution metadata
+            executor = step.executor
+            print(f"S{step.step_index + 1} executor: {executor.name} (Used: {executor.used})")
             
         # Check final conclusion
-        conclusion = rsl["final_conclusion"]
-        print(f"\nFinal Conclusion: {conclusion['content']}")
+        print(f"\nFinal Conclusion: {view.conclusion_content}")
             
     except Exception as e:
         print(f"\nError running demo: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
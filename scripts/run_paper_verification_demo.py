@@ -13,19 +13,13 @@ Usage:
 This script must be run from the repository root directory.
 """
 
-import json
 import sys
 from datetime import datetime, timezone
-from pathlib import Path
-
-# Add src to path for imports
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parent
-SRC_DIR = REPO_ROOT / "src"
-sys.path.insert(0, str(SRC_DIR))
 
+from _demo_bootstrap import DOC_PATH, REPO_PREFIX, RUNS_DIR, SCHEMA_PATH
 from reasonos.kernel import run_paper_verification_task
 from reasonos.utils.validate import validate_rsl
+from _json_io import dump_rsl
 
 
 def main() -> int:
@@ -37,11 +31,11 @@ def main() -> int:
     """
     # Define inputs
     paragraph = "Model X improves accuracy by 15 percent on Dataset Y."
-    document_path = REPO_ROOT / "data" / "demo_paper.txt"
+    document_path = DOC_PATH
 
     # Define paths
-    schema_path = REPO_ROOT / "specs" / "rsl" / "rsl.schema.json"
-    runs_dir = REPO_ROOT / "runs"
+    schema_path = SCHEMA_PATH
+    runs_dir = RUNS_DIR
 
     # Ensure runs directory exists
     runs_dir.mkdir(parents=True, exist_ok=True)
@@ -61,11 +55,10 @@ def main() -> int:
         output_file = runs_dir / f"run_{timestamp}_paper_verification.json"
 
         # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(rsl_doc, f, indent=2)
+        dump_rsl(rsl_doc, output_file)
 
         # Print required outputs
-        print(output_file.relative_to(REPO_ROOT))
+        print(str(output_file).removeprefix(REPO_PREFIX))
         print("Schema validation passed")
         print(rsl_doc["final_conclusion"]["content"])
 
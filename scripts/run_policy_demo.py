@@ -5,29 +5,23 @@ ReasonOS Policy Demo Script
 Demonstrates the policy layer blocking an output due to insufficient confidence.
 """
 
-import json
-import sys
-from pathlib import Path
+import traceback
 
-# Add src to path
-sys.path.append("src")
-
-from reasonos.kernel import run_paper_verification_task
-from reasonos.utils.validate import validate_rsl
-from reasonos.utils.ids import new_run_id
-from reasonos.utils.time import now_iso
+from _demo_bootstrap import DOC_PATH, RUNS_DIR, SCHEMA_PATH
+from reasonos.utils.time import compact_utc_stamp
+from _json_io import dump_rsl
 
 def main():
+    from reasonos.kernel import run_paper_verification_task
+    from reasonos.utils.validate import validate_rsl
+
     print("=== ReasonOS Policy Demo ===")
     
     # Setup paths
-    base_dir = Path(__file__).parent.parent
-    data_dir = base_dir / "data"
-    runs_dir = base_dir / "runs"
+    runs_dir = RUNS_DIR
     runs_dir.mkdir(exist_ok=True)
-    schema_path = str(base_dir / "specs/rsl/rsl.schema.json")
-    
-    document_path = str(data_dir / "demo_paper.txt")
+    schema_path = str(SCHEMA_PATH)
+    document_path = str(DOC_PATH)
     
     # Scenario: Claim that is not supported by the document
     # Document says 53.5% on Dataset A.
@@ -58,11 +52,10 @@ def main():
         
         # Save run output
         run_id = rsl["run"]["run_id"]
-        timestamp = now_iso().replace(":", "").replace("-", "").split(".")[0]
+        timestamp = compact_utc_stamp()
         output_file = runs_dir / f"run_{timestamp}_policy_demo.json"
         
-        with open(output_file, "w") as f:
-            json.dump(rsl, f, indent=2)
+        dump_rsl(rsl, output_file)
             
         print(f"\nRun completed. Output saved to: {output_file}")
             
@@ -81,7 +74,6 @@ def main():
             
     except Exception as e:
         print(f"\nError running demo: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
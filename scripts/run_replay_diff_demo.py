@@ -9,36 +9,32 @@ Demonstrates:
 """
 
 import json
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.append("src")
-
-from reasonos.kernel import run_paper_verification_task
-from reasonos.replay.replay_engine import replay_run
-from reasonos.diff.run_diff import diff_runs
-from reasonos.utils.validate import validate_rsl
-from reasonos.utils.time import now_iso
+from _demo_bootstrap import DOC_PATH, RUNS_DIR, SCHEMA_PATH
+from reasonos.utils.time import compact_utc_stamp
+from _json_io import dump_rsl
 
 def save_run(rsl, name, runs_dir):
-    timestamp = now_iso().replace(":", "").replace("-", "").split(".")[0]
+    timestamp = compact_utc_stamp()
     output_file = runs_dir / f"run_{timestamp}_{name}.json"
-    with open(output_file, "w") as f:
-        json.dump(rsl, f, indent=2)
+    dump_rsl(rsl, output_file)
     return output_file
 
 def main():
+    from reasonos.kernel import run_paper_verification_task
+    from reasonos.replay.replay_engine import replay_run, save_replay_run
+    from reasonos.diff.run_diff import diff_runs
+    from reasonos.utils.doc_cache import load_document
+    from reasonos.utils.validate import validate_rsl
+
     print("=== ReasonOS Replay and Diff Demo ===")
     
     # Setup paths
-    base_dir = Path(__file__).parent.parent
-    data_dir = base_dir / "data"
-    runs_dir = base_dir / "runs"
+    runs_dir = RUNS_DIR
     runs_dir.mkdir(exist_ok=True)
-    schema_path = str(base_dir / "specs/rsl/rsl.schema.json")
-    
-    document_path = str(data_dir / "demo_paper.txt")
+    schema_path = str(SCHEMA_PATH)
+    document_path = str(DOC_PATH)
+    document = load_document(document_path)
     
     # === Part 1: Original Run ===
     paragraph_1 = "Model X improves accuracy by 15 percent on Dataset Y."
@@ -47,7 +43,8 @@ def main():
     rsl_1 = run_paper_verification_task(
         paragraph=paragraph_1,
         document_path=document_path,
-        policy_path="policies/default_policy.json"
+        policy_path="policies/default_policy.json",
+        document=document
     )
     
     run_path_1 = save_run(rsl_1, "original", runs_dir)
@@ -63,18 +60,14 @@ def main():
 
     # === Part 2: Replay ===
     print(f"\nReplaying run: {run_path_1}")
-    original_run, replayed_run = replay_run(str(run_path_1))
+    original_run, replayed_run = replay_run(str(run_path_1), save_to_disk=False)
     
-    # Determine replay path (it was saved by replay_engine)
-    # We can find it by looking for the latest file or just checking the return
-    # The replay_engine saves it alongside the original.
-    # Let's find it.
-    replay_files = list(runs_dir.glob("*_replay_*.json"))
-    replay_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    replay_path = replay_files[0]
+    # Save the replay alongside the original and keep its path
+    replay_path = save_replay_run(str(run_path_1), replayed_run)
     print(f"Replay run: {replay_path}")
     
-    # Diff original vs replay
+    # Diff original vs replay (the replay is not re-validated; the original
+    # was validated above and the diff catches any divergence)
     diff_result = diff_runs(original_run, replayed_run)
     print(f"Replay diff summary: {diff_result['summary']}")
     
@@ -90,7 +83,8 @@ def main():
     rsl_2 = run_paper_verification_task(
         paragraph=paragraph_2,
         document_path=document_path,
-        policy_path="policies/default_policy.json"
+        policy_path="policies/default_policy.json",
+        document=document
     )
     save_run(rsl_2, "modified", runs_dir)
     
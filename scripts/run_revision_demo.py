@@ -16,20 +16,15 @@ Usage:
 This script must be run from the repository root directory.
 """
 
-import json
 import sys
+import traceback
 from datetime import datetime, timezone
-from pathlib import Path
-
-# Add src to path for imports
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parent
-SRC_DIR = REPO_ROOT / "src"
-sys.path.insert(0, str(SRC_DIR))
 
+from _demo_bootstrap import DATA_DIR, DOC_PATH, REPO_PREFIX, RUNS_DIR, SCHEMA_PATH
 from reasonos.kernel import run_paper_verification_task
 from reasonos.utils.validate import validate_rsl
 from reasonos.storage.memory_store import clear_memory
+from _json_io import dump_rsl
 
 
 def main() -> int:
@@ -40,10 +35,10 @@ def main() -> int:
         0 on success, 1 on error.
     """
     # Define paths
-    schema_path = REPO_ROOT / "specs" / "rsl" / "rsl.schema.json"
-    runs_dir = REPO_ROOT / "runs"
-    document_path = REPO_ROOT / "data" / "demo_paper.txt"
-    memory_path = REPO_ROOT / "data" / "memory.json"
+    schema_path = SCHEMA_PATH
+    runs_dir = RUNS_DIR
+    document_path = DOC_PATH
+    memory_path = DATA_DIR / "memory.json"
 
     # Ensure runs directory exists
     runs_dir.mkdir(parents=True, exist_ok=True)
@@ -82,11 +77,10 @@ def main() -> int:
         output_file = runs_dir / f"run_{timestamp}_revision_demo.json"
 
         # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(rsl_doc, f, indent=2)
+        dump_rsl(rsl_doc, output_file)
 
         # Print results
-        print(output_file.relative_to(REPO_ROOT))
+        print(str(output_file).removeprefix(REPO_PREFIX))
         
         # Check for revisions
         s1 = rsl_doc["steps"][0]
@@ -110,7 +104,6 @@ def main() -> int:
         return 1
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
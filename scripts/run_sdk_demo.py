@@ -9,27 +9,22 @@ Demonstrates the public Developer API:
 4. Replay the run deterministically
 """
 
-import sys
-import json
-from pathlib import Path
+import traceback
 
-# Add src to path
-sys.path.append("src")
-
-from reasonos.sdk.client import ReasonOSClient
-from reasonos.utils.validate import validate_rsl
+from _demo_bootstrap import DOC_PATH, RUNS_DIR, SCHEMA_PATH
+from _json_io import dump_rsl
 
 def main():
+    from reasonos.sdk.client import ReasonOSClient
+    from reasonos.utils.validate import validate_rsl
+
     print("=== ReasonOS SDK Demo ===")
     
     # Setup paths
-    base_dir = Path(__file__).parent.parent
-    data_dir = base_dir / "data"
-    runs_dir = base_dir / "runs"
+    runs_dir = RUNS_DIR
     runs_dir.mkdir(exist_ok=True)
-    schema_path = str(base_dir / "specs/rsl/rsl.schema.json")
-    
-    document_path = str(data_dir / "demo_paper.txt")
+    schema_path = str(SCHEMA_PATH)
+    document_path = str(DOC_PATH)
     
     # 1. Initialize Client
     client = ReasonOSClient(
@@ -55,8 +50,9 @@ def main():
         accounting = rsl.get("accounting", {})
         
         content = conclusion.get('content', '')
-        if "Confidence:" in content:
-            content = content.split("Confidence:")[0].strip()
+        head, sep, _ = content.partition("Confidence:")
+        if sep:
+            content = head.strip()
         print(f"Final conclusion: {content}")
         print(f"Confidence: {conclusion.get('confidence')}")
         print("Accounting:")
@@ -66,14 +62,15 @@ def main():
         # Save run for replay test
         run_id = rsl["run"]["run_id"]
         output_file = runs_dir / f"sdk_demo_run_{run_id}.json"
-        with open(output_file, "w") as f:
-            json.dump(rsl, f, indent=2)
+        dump_rsl(rsl, output_file)
             
         # 4. Replay Run
         print("\nReplaying run...")
         replayed_rsl = client.replay_run(str(output_file))
         
-        # Verify equivalence
+        # Verify equivalence. The replay is not re-validated against the
+        # schema: it comes from the same kernel as the validated original,
+        # and the run_hash comparison below is the check that matters here.
         orig_hash = rsl.get("audit", {}).get("run_hash")
         replay_hash = replayed_rsl.get("audit", {}).get("run_hash")
         
@@ -84,7 +81,6 @@ def main():
             
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
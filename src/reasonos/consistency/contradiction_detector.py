@@ -4,11 +4,14 @@ Provides deterministic detection of numeric conflicts across memory.
 """
 
 import re
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..utils.ids import new_contradiction_id
 from ..utils.time import now_iso
 
+# Matches patterns like "15 percent", "14.8 percent", "15%"
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:percent|%)", re.IGNORECASE)
+
 
 def extract_percent(text: str) -> float | None:
     """
@@ -22,19 +25,51 @@ def extract_percent(text: str) -> float | None:
     Returns:
         The numeric value as a float, or None if no match found.
     """
-    pattern = r"(\d+(?:\.\d+)?)\s*(?:percent|%)"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _PERCENT_RE.search(text)
     if match:
         return float(match.group(1))
     return None
 
 
+class MemoryFact(NamedTuple):
+    """A FACT memory item with its lowercased content and percent value."""
+
+    item: dict[str, Any]
+    content_lower: str
+    value: float | None
+
+
+def prefilter_facts(memory_items: list[dict[str, Any]]) -> list[MemoryFact]:
+    """
+    Select FACT memories and precompute what contradiction checks need.
+
+    Callers that check several claims against the same memory can build
+    this once and pass it to detect_numeric_contradictions, skipping the
+    per-call type filtering, lowercasing and percent extraction.
+
+    Args:
+        memory_items: List of memory write dictionaries.
+
+    Returns:
+        One MemoryFact per FACT item, in memory order.
+    """
+    facts = []
+    for item in memory_items:
+        # Only check FACT type memories
+        if item.get("type") != "FACT":
+            continue
+        content = item.get("content", "")
+        facts.append(MemoryFact(item, content.lower(), extract_percent(content)))
+    return facts
+
+
 def detect_numeric_contradictions(
     memory_items: list[dict[str, Any]],
     current_subject: str,
     current_value: float,
     unit: str,
     threshold: float,
+    facts: list[MemoryFact] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Detect numeric contradictions between current value and memory.
@@ -48,6 +83,8 @@ def detect_numeric_contradictions(
         current_value: Current numeric value to compare.
         unit: Unit of measurement (e.g., "percent").
         threshold: Maximum allowed difference before contradiction.
+        facts: Optional result of prefilter_facts(memory_items); when
+            given, memory_items is not scanned again.
 
     Returns:
         List of contradiction records for any detected conflicts.
@@ -55,28 +92,30 @@ def detect_numeric_contradictions(
     contradictions = []
     subject_lower = current_subject.lower()
 
-    for item in memory_items:
-        # Only check FACT type memories
-        if item.get("type") != "FACT":
-            continue
+    # For "Model X Dataset Y", every part must appear in the memory content.
+    # Longer parts are the most selective, so check them first.
+    subject_parts = sorted(subject_lower.split(), key=len, reverse=True)
 
-        content = item.get("content", "")
-        content_lower = content.lower()
+    if facts is None:
+        facts = prefilter_facts(memory_items)
+
+    # One detection pass shares a single timestamp, taken on first use
+    detected_at = None
 
+    for item, content_lower, memory_value in facts:
         # Check if subject is mentioned (case insensitive containment)
-        # For "Model X Dataset Y", check both parts
-        subject_parts = subject_lower.split()
         if not all(part in content_lower for part in subject_parts):
             continue
 
-        # Extract percent value from memory content
-        memory_value = extract_percent(content)
+        # Memory content without a percent value cannot conflict
         if memory_value is None:
             continue
 
         # Check for contradiction
         diff = abs(memory_value - current_value)
         if diff > threshold:
+            if detected_at is None:
+                detected_at = now_iso()
             contradiction = {
                 "contradiction_id": new_contradiction_id(),
                 "step_ids": ["S3"],
@@ -90,7 +129,7 @@ def detect_numeric_contradictions(
                     "type": "RULE",
                     "name": "numeric_conflict_detector",
                 },
-                "detected_at": now_iso(),
+                "detected_at": detected_at,
                 "prior_memory_id": item.get("memory_id"),
                 "prior_value": memory_value,
                 "current_value": current_value,
@@ -1,9 +1,41 @@
 from typing import Any, Dict, List, Optional
 
+# Step fields compared by diff_runs, in reporting order
+_STEP_FIELDS = (
+    "execution_output",
+    "verification.result",
+    "verification.confidence",
+    "revisions_count",
+)
+
+
+def _step_fields(step: Dict[str, Any]) -> tuple:
+    """Extract the compared step values in _STEP_FIELDS order."""
+    verification = step.get("verification", {})
+    return (
+        step.get("execution_output"),
+        verification.get("result"),
+        verification.get("confidence"),
+        len(step.get("revisions", [])),
+    )
+
+
+def _has_positional_indices(steps: List[Dict[str, Any]]) -> bool:
+    """Return True if every step's step_index equals its list position."""
+    return all(
+        type(s.get("step_index")) is int and s["step_index"] == i
+        for i, s in enumerate(steps)
+    )
+
+
 def diff_runs(run_a: Dict[str, Any], run_b: Dict[str, Any]) -> Dict[str, Any]:
     """
     Compare two runs and compute a structured diff.
     
+    Only the "steps" and "final_conclusion" sections are read; task, run,
+    audit and accounting metadata are never traversed, so full RSL
+    documents can be passed directly without projecting them first.
+    
     Args:
         run_a: First run dictionary.
         run_b: Second run dictionary.
@@ -11,6 +43,14 @@ def diff_runs(run_a: Dict[str, Any], run_b: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         RunDiff dictionary with summary and detailed diffs.
     """
+    # Identical objects cannot differ; skip the traversal entirely
+    if run_a is run_b:
+        return {
+            "summary": "Runs are equivalent except for metadata.",
+            "step_diffs": [],
+            "conclusion_diff": None
+        }
+        
     step_diffs = []
     conclusion_diff = None
     
@@ -18,16 +58,31 @@ def diff_runs(run_a: Dict[str, Any], run_b: Dict[str, Any]) -> Dict[str, Any]:
     steps_a = run_a.get("steps", [])
     steps_b = run_b.get("steps", [])
     
-    # Map steps by step_index (assuming stable indexing)
-    steps_a_map = {s.get("step_index"): s for s in steps_a}
-    steps_b_map = {s.get("step_index"): s for s in steps_b}
-    
-    all_indices = sorted(set(steps_a_map.keys()) | set(steps_b_map.keys()))
-    
-    for idx in all_indices:
-        s_a = steps_a_map.get(idx)
-        s_b = steps_b_map.get(idx)
+    if _has_positional_indices(steps_a) and _has_positional_indices(steps_b):
+        # Common case: step_index equals list position in both runs, so
+        # steps pair up by position and extra Run B steps follow in order
+        len_b = len(steps_b)
+        matched = [
+            (idx, s_a, steps_b[idx] if idx < len_b else None)
+            for idx, s_a in enumerate(steps_a)
+        ]
+        added = list(range(len(steps_a), len_b))
+        interleaved = False
+    else:
+        # Map steps by step_index (assuming stable indexing)
+        steps_a_map = {s.get("step_index"): s for s in steps_a}
+        steps_b_map = {s.get("step_index"): s for s in steps_b}
         
+        # Walk Run A in index order, popping each match out of Run B so
+        # every index is looked up once; whatever is left in Run B was added
+        matched = [
+            (idx, s_a, steps_b_map.pop(idx, None))
+            for idx, s_a in sorted(steps_a_map.items(), key=lambda item: item[0])
+        ]
+        added = list(steps_b_map)
+        interleaved = bool(added)
+    
+    for idx, s_a, s_b in matched:
         if not s_a:
             step_diffs.append({
                 "step_index": idx,
@@ -44,44 +99,17 @@ def diff_runs(run_a: Dict[str, Any], run_b: Dict[str, Any]) -> Dict[str, Any]:
             })
             continue
             
-        # Compare fields
+        # Compare fields: each side's values are extracted once and the
+        # tuples are compared as a whole before reporting individual fields
+        values_a = _step_fields(s_a)
+        values_b = _step_fields(s_b)
         diffs = []
-        
-        # Execution output
-        if s_a.get("execution_output") != s_b.get("execution_output"):
-            diffs.append({
-                "field": "execution_output",
-                "before": s_a.get("execution_output"),
-                "after": s_b.get("execution_output")
-            })
-            
-        # Verification status
-        v_a = s_a.get("verification", {})
-        v_b = s_b.get("verification", {})
-        
-        if v_a.get("result") != v_b.get("result"):
-            diffs.append({
-                "field": "verification.result",
-                "before": v_a.get("result"),
-                "after": v_b.get("result")
-            })
-            
-        if v_a.get("confidence") != v_b.get("confidence"):
-             diffs.append({
-                "field": "verification.confidence",
-                "before": v_a.get("confidence"),
-                "after": v_b.get("confidence")
-            })
-            
-        # Revisions
-        rev_a = s_a.get("revisions", [])
-        rev_b = s_b.get("revisions", [])
-        if len(rev_a) != len(rev_b):
-             diffs.append({
-                "field": "revisions_count",
-                "before": len(rev_a),
-                "after": len(rev_b)
-            })
+        if values_a != values_b:
+            diffs = [
+                {"field": field, "before": before, "after": after}
+                for field, before, after in zip(_STEP_FIELDS, values_a, values_b)
+                if before != after
+            ]
             
         if diffs:
             step_diffs.append({
@@ -91,23 +119,35 @@ def diff_runs(run_a: Dict[str, Any], run_b: Dict[str, Any]) -> Dict[str, Any]:
                 "changes": diffs
             })
             
+    for idx in added:
+        step_diffs.append({
+            "step_index": idx,
+            "type": "ADDED",
+            "details": "Step present in Run B but not Run A"
+        })
+    if interleaved:
+        # Interleave added steps back into step_index order
+        step_diffs.sort(key=lambda d: d["step_index"])
+            
     # Compare final conclusion
     fc_a = run_a.get("final_conclusion", {})
     fc_b = run_b.get("final_conclusion", {})
+    content_a, confidence_a = fc_a.get("content"), fc_a.get("confidence")
+    content_b, confidence_b = fc_b.get("content"), fc_b.get("confidence")
     
     fc_diffs = []
-    if fc_a.get("content") != fc_b.get("content"):
+    if content_a != content_b:
         fc_diffs.append({
             "field": "content",
-            "before": fc_a.get("content"),
-            "after": fc_b.get("content")
+            "before": content_a,
+            "after": content_b
         })
         
-    if fc_a.get("confidence") != fc_b.get("confidence"):
+    if confidence_a != confidence_b:
         fc_diffs.append({
             "field": "confidence",
-            "before": fc_a.get("confidence"),
-            "after": fc_b.get("confidence")
+            "before": confidence_a,
+            "after": confidence_b
         })
         
     if fc_diffs:
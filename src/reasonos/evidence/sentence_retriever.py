@@ -3,15 +3,51 @@
 Provides deterministic keyword-overlap retrieval without embeddings.
 """
 
-from typing import Any
+import heapq
+from functools import lru_cache
+from typing import Any, NamedTuple, Sequence
 
 from ..utils.text import split_sentences, tokenize
 
 
+class _SentenceIndex(NamedTuple):
+    """Sentences of a document with an inverted token index."""
+
+    sentences: tuple[str, ...]
+    # token -> indices of the sentences containing it, ascending
+    postings: dict[str, tuple[int, ...]]
+
+
+@lru_cache(maxsize=64)
+def _query_tokens(paragraph: str) -> frozenset[str]:
+    """Return the distinct tokens of a query paragraph."""
+    return frozenset(tokenize(paragraph))
+
+
+@lru_cache(maxsize=16)
+def _index_sentences(sentences: tuple[str, ...]) -> _SentenceIndex:
+    """Tokenize each sentence once and build the inverted index."""
+    postings: dict[str, list[int]] = {}
+    for idx, sentence in enumerate(sentences):
+        for token in frozenset(tokenize(sentence)):
+            postings.setdefault(token, []).append(idx)
+    return _SentenceIndex(
+        sentences=sentences,
+        postings={token: tuple(ids) for token, ids in postings.items()},
+    )
+
+
+@lru_cache(maxsize=16)
+def _index_document(document_text: str) -> _SentenceIndex:
+    """Split a document into sentences and index them."""
+    return _index_sentences(tuple(split_sentences(document_text)))
+
+
 def retrieve_evidence(
     paragraph: str,
     document_text: str,
     k: int = 3,
+    sentences: Sequence[str] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Retrieve top-k evidence sentences from document based on keyword overlap.
@@ -22,7 +58,11 @@ def retrieve_evidence(
     Args:
         paragraph: The query paragraph containing the claim.
         document_text: The full document text to search.
-        k: Maximum number of evidence sentences to return.
+        k: Maximum number of evidence sentences to return. A negative k
+            drops the last |k| sentences of the full ranking, as slicing
+            the ranking with [:k] would.
+        sentences: Optional pre-split sentences of document_text, used
+            instead of splitting the text again.
 
     Returns:
         A list of evidence dictionaries, each containing:
@@ -34,39 +74,83 @@ def retrieve_evidence(
         return []
 
     # Tokenize query
-    query_tokens = set(tokenize(paragraph))
+    query_tokens = _query_tokens(paragraph)
     if not query_tokens:
         return []
 
-    # Split document into sentences
-    sentences = split_sentences(document_text)
-    if not sentences:
+    # Split document into sentences and index them. The index is cached,
+    # so repeated queries against the same document (or the same pre-split
+    # tuple from the document cache) skip re-tokenization.
+    if sentences is None:
+        index = _index_document(document_text)
+    else:
+        index = _index_sentences(tuple(sentences))
+    if not index.sentences:
         return []
 
-    # Score each sentence by token overlap
-    scored_sentences = []
-    for idx, sentence in enumerate(sentences):
-        sentence_tokens = set(tokenize(sentence))
-        overlap = len(query_tokens & sentence_tokens)
-        # Normalize score to [0, 1]
-        relevance_score = overlap / max(1, len(query_tokens))
-        scored_sentences.append({
-            "content": sentence,
-            "relevance_score": round(relevance_score, 3),
-            "sentence_index": idx,
-            "overlap_count": overlap,
-        })
+    # Score by token overlap: walk the postings of the query tokens, so
+    # only sentences sharing at least one token are touched
+    overlaps: dict[int, int] = {}
+    postings = index.postings
+    for token in query_tokens:
+        for idx in postings.get(token, ()):
+            overlaps[idx] = overlaps.get(idx, 0) + 1
+
+    if k < 0:
+        # The full ranking has one entry per sentence
+        k = max(0, len(index.sentences) + k)
 
-    # Sort by overlap count descending, then by sentence index ascending for ties
-    scored_sentences.sort(key=lambda x: (-x["overlap_count"], x["sentence_index"]))
+    # Keep the top k by overlap count descending, then by sentence index
+    # ascending for ties
+    top = heapq.nsmallest(k, ((-count, idx) for idx, count in overlaps.items()))
 
-    # Take top k and remove internal scoring field
+    # Fewer than k matching sentences: fill with zero-overlap sentences in
+    # document order, as a full ranking would
+    if len(top) < k:
+        for idx in range(len(index.sentences)):
+            if idx not in overlaps:
+                top.append((0, idx))
+                if len(top) == k:
+                    break
+
+    denominator = max(1, len(query_tokens))
     results = []
-    for item in scored_sentences[:k]:
+    for neg_overlap, idx in top:
+        # Normalize score to [0, 1]
+        relevance_score = -neg_overlap / denominator
         results.append({
-            "content": item["content"],
-            "relevance_score": item["relevance_score"],
-            "sentence_index": item["sentence_index"],
+            "content": index.sentences[idx],
+            "relevance_score": round(relevance_score, 3),
+            "sentence_index": idx,
         })
 
     return results
+
+
+def retrieve_evidence_batch(
+    paragraphs: Sequence[str],
+    document_text: str,
+    k: int = 3,
+    sentences: Sequence[str] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Retrieve top-k evidence for several paragraphs against one document.
+
+    The document is split and indexed once and shared by every query.
+
+    Args:
+        paragraphs: The query paragraphs.
+        document_text: The full document text to search.
+        k: Maximum number of evidence sentences per paragraph.
+        sentences: Optional pre-split sentences of document_text.
+
+    Returns:
+        One evidence list per paragraph, in input order, each as returned
+        by retrieve_evidence.
+    """
+    if sentences is not None:
+        sentences = tuple(sentences)
+    return [
+        retrieve_evidence(paragraph, document_text, k=k, sentences=sentences)
+        for paragraph in paragraphs
+    ]
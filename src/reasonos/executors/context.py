@@ -0,0 +1,19 @@
+"""Execution context type shared by ReasonOS executors."""
+
+from typing import Any, Sequence, TypedDict
+
+
+class ExecutionContext(TypedDict, total=False):
+    """
+    Keys the kernel may place in an executor's context dictionary.
+
+    Every key is optional; each executor documents which ones it needs.
+    """
+
+    task: dict[str, Any]
+    inputs: dict[str, Any]
+    document_text: str
+    document_sentences: Sequence[str]
+    principal: float
+    annual_rate: float
+    months: int
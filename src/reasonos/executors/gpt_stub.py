@@ -1,6 +1,8 @@
 from typing import Any
 
-def execute(step: dict[str, Any], context: dict[str, Any]) -> str:
+from .context import ExecutionContext
+
+def execute(step: dict[str, Any], context: ExecutionContext) -> str:
     """
     Execute a step using the GPT stub.
     
@@ -6,8 +6,10 @@ without making any actual LLM API calls.
 
 from typing import Any
 
+from .context import ExecutionContext
 
-def execute(step: dict[str, Any], context: dict[str, Any]) -> str:
+
+def execute(step: dict[str, Any], context: ExecutionContext) -> str:
     """
     Execute a model inference step (stub implementation).
 
@@ -1,7 +1,9 @@
 from typing import Any
+
 from ..evidence.sentence_retriever import retrieve_evidence
+from .context import ExecutionContext
 
-def execute(step: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+def execute(step: dict[str, Any], context: ExecutionContext) -> dict[str, Any]:
     """
     Execute a step using the Retriever stub.
     
@@ -31,7 +33,12 @@ def execute(step: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
             "summary": "Retriever failed: missing paragraph or document text"
         }
         
-    evidence_results = retrieve_evidence(paragraph, document_text, k=3)
+    evidence_results = retrieve_evidence(
+        paragraph,
+        document_text,
+        k=3,
+        sentences=context.get("document_sentences"),
+    )
     
     return {
         "retrieved_evidence": evidence_results,
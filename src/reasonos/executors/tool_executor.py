@@ -6,9 +6,10 @@ Executes tool calls and returns structured results.
 from typing import Any
 
 from ..tools.calculator_tool import calculate_amortized_payment
+from .context import ExecutionContext
 
 
-def execute(step: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+def execute(step: dict[str, Any], context: ExecutionContext) -> dict[str, Any]:
     """
     Execute a tool call step.
 
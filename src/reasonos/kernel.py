@@ -3,8 +3,12 @@
 Coordinates task execution, step processing, verification, and RSL document assembly.
 """
 
-from typing import Any
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Mapping, NamedTuple
 
+from .utils.doc_cache import Document, load_document, load_documents
 from .rsl import (
     build_task,
     build_run,
@@ -14,8 +18,16 @@ from .rsl import (
     build_audit,
     build_verification,
 )
-from .utils.ids import new_task_id, new_run_id, new_step_id, new_evidence_id
+from .utils.ids import (
+    new_task_id,
+    new_run_id,
+    new_ids,
+    new_evidence_id,
+    new_memory_id,
+    new_revision_id,
+)
 from .utils.time import now_iso
+from .utils.canonical import canonical_json_bytes
 from .executors import model_executor, tool_executor
 from .verifiers.rule_verifier import verify_step, verify_claim_support
 from .policy.policy_loader import load_policy
@@ -26,13 +38,214 @@ from .policy.policy_engine import (
 )
 from .routing.router import resolve_and_attach_executor
 from .executors import gpt_stub, o3_stub, retriever_stub
+from .evidence.sentence_retriever import retrieve_evidence
+from .storage.memory_store import (
+    load_memory,
+    append_memory,
+    append_memory_background,
+)
+from .consistency.contradiction_detector import (
+    detect_numeric_contradictions,
+    extract_percent,
+)
+from .revision.revision_engine import rewrite_claim
+from .accounting.ledger import AccountingLedger
 
 
 KERNEL_VERSION = "0.1.0"
 RSL_VERSION = "0.1"
 
+# Parse the evidence percent or the scope phrase out of a verifier issue
+# string, e.g. "... evidence shows 14.8%" or "Scope limitation detected: '...'"
+_ISSUE_RE = re.compile(
+    r"evidence shows (?P<percent>\d+\.?\d*)%"
+    r"|Scope limitation[^']*'(?P<scope>[^']+)'"
+)
+
+
+class _IssueSummary(NamedTuple):
+    """Values parsed out of verifier issue strings."""
+
+    evidence_percent: str | None
+    scope_info: str | None
+
+
+def _summarize_issues(issues: Iterable[str]) -> _IssueSummary:
+    """
+    Parse the evidence percent and scope phrase out of verifier issues.
+
+    Issues are walked once with a single regex search each, as the
+    verifier reports the percent and the scope in separate issues; when
+    several issues carry the same value, the last one wins.
+    """
+    evidence_percent = None
+    scope_info = None
+    for issue in issues:
+        match = _ISSUE_RE.search(issue)
+        if match is None:
+            continue
+        if match.lastgroup == "percent":
+            evidence_percent = match.group("percent")
+        else:
+            scope_info = match.group("scope")
+    return _IssueSummary(evidence_percent, scope_info)
+
+# The demo task's fixed parameters. run_demo_task copies _DEMO_INPUTS for
+# each run, so a caller modifying a returned document cannot change it
+_DEMO_OBJECTIVE = (
+    "What is the monthly payment for a 10000 dollar loan "
+    "at 5 percent annual interest for 3 years?"
+)
+_DEMO_INPUTS = {
+    "principal": 10000,
+    "annual_rate": 0.05,
+    "months": 36,
+}
+
+
+# Final conclusion texts, filled in with str.format_map
+_CONCLUSION_TEMPLATES = {
+    "REVISED": (
+        "The original claim was revised after contradiction. "
+        "The corrected claim states that {claim} "
+        "Confidence: {confidence:.2f}."
+    ),
+    "CONTRADICTED_BY_DOCUMENT": (
+        "The claim is CONTRADICTED by the document, which reports {reported}% "
+        "rather than {current}%. "
+        "This also conflicts with prior memory recorded from earlier verified runs. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "CONFLICTS_WITH_MEMORY": (
+        "The claim is PARTIALLY SUPPORTED but conflicts with prior memory. "
+        "The document reports {reported}%, "
+        "which differs from the claimed {current}%. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "SUPPORTED": (
+        "The claim is SUPPORTED by the evidence. "
+        "The document confirms the stated improvement. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "PARTIAL_PERCENT_AND_SCOPE": (
+        "The claim is PARTIALLY SUPPORTED. "
+        "The evidence reports {evidence_percent}% {scope_info}, "
+        "which is close to the claimed value but not identical "
+        "and does not generalize beyond that scope. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "PARTIAL_PERCENT": (
+        "The claim is PARTIALLY SUPPORTED. "
+        "The evidence reports {evidence_percent}%, "
+        "which differs slightly from the claimed value. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "PARTIAL_SCOPE": (
+        "The claim is PARTIALLY SUPPORTED. "
+        "The evidence is limited to {scope_info} "
+        "and may not generalize beyond that scope. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "PARTIAL": (
+        "The claim is PARTIALLY SUPPORTED. "
+        "Some aspects of the claim could not be fully verified. "
+        "Confidence: {confidence:.2f}."
+    ),
+    "WEAK": (
+        "The claim has WEAK support. "
+        "The evidence does not adequately support the stated claim. "
+        "Confidence: {confidence:.2f}."
+    ),
+}
+
+# Template keys for PARTIALLY_SUPPORTED claims by (has percent, has scope)
+_PARTIAL_TEMPLATE_KEYS = {
+    (True, True): "PARTIAL_PERCENT_AND_SCOPE",
+    (True, False): "PARTIAL_PERCENT",
+    (False, True): "PARTIAL_SCOPE",
+    (False, False): "PARTIAL",
+}
+
+_CONTRADICTION_WARNING = (
+    " WARNING: This claim conflicts with prior memory. "
+    "A numeric discrepancy of {discrepancy:.1f}% was detected."
+)
+
+
+def _conclusion_content(
+    verification_status: str,
+    contradictions: list[dict[str, Any]],
+    evidence_percent: str | None,
+    scope_info: str | None,
+    confidence: float,
+) -> str:
+    """Pick and fill the conclusion template for an unrevised claim."""
+    fields = {
+        "confidence": confidence,
+        "evidence_percent": evidence_percent,
+        "scope_info": scope_info,
+    }
+    if contradictions:
+        # Primary reason is document contradiction, memory is secondary
+        fields["reported"] = evidence_percent or contradictions[0]["prior_value"]
+        fields["current"] = contradictions[0]["current_value"]
+        if verification_status == "WEAK":
+            key = "CONTRADICTED_BY_DOCUMENT"
+        else:
+            key = "CONFLICTS_WITH_MEMORY"
+    elif verification_status == "SUPPORTED":
+        key = "SUPPORTED"
+    elif verification_status == "PARTIALLY_SUPPORTED":
+        key = _PARTIAL_TEMPLATE_KEYS[bool(evidence_percent), bool(scope_info)]
+    else:
+        key = "WEAK"
+    return _CONCLUSION_TEMPLATES[key].format_map(fields)
+
+
+def _contradiction_warning(contradictions: list[dict[str, Any]]) -> str:
+    """Build the notice appended to conclusions that conflict with memory."""
+    first = contradictions[0]
+    return _CONTRADICTION_WARNING.format(
+        discrepancy=abs(first["current_value"] - first["prior_value"])
+    )
+
+
+@lru_cache(maxsize=256)
+def _rewrite_claim_cached(paragraph: str, evidence_sentences: tuple[str, ...]) -> str:
+    # Batches often retry the same claim against the same evidence
+    return rewrite_claim(paragraph, list(evidence_sentences))
+
+
+def _mark_executed(
+    step: dict[str, Any],
+    ended_at: str,
+    output: str,
+    evidence: list[dict[str, Any]] | None = None,
+    executor_used: str | None = None,
+) -> None:
+    """Record a step's execution result and move it to EXECUTED."""
+    updates: dict[str, Any] = {
+        "status": "EXECUTED",
+        "ended_at": ended_at,
+        "execution_output": output,
+    }
+    if evidence is not None:
+        updates["evidence"] = evidence
+    if executor_used is not None:
+        updates["execution"] = {"executor_used": executor_used}
+    step.update(updates)
+
 
-def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str, Any]:
+def _mark_verified(step: dict[str, Any], verification: dict[str, Any]) -> None:
+    """Attach a step's verification and move it to VERIFIED."""
+    step["verification"] = verification
+    step["status"] = "VERIFIED"
+
+
+def run_demo_task(
+    policy_path: str = "policies/default_policy.json",
+    policy: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
     """
     Run the demo loan payment calculation task.
 
@@ -45,22 +258,20 @@ def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str
         6. Finalize run status
         7. Assemble full RSL document
 
+    Args:
+        policy_path: Path to the policy JSON file.
+        policy: Optional already loaded policy. When given, policy_path
+            is not read.
+
     Returns:
         A complete RSL document dictionary ready for validation and output.
     """
-    # Demo task parameters
-    demo_objective = (
-        "What is the monthly payment for a 10000 dollar loan "
-        "at 5 percent annual interest for 3 years?"
-    )
-    demo_inputs = {
-        "principal": 10000,
-        "annual_rate": 0.05,
-        "months": 36,
-    }
+    # Demo task parameters are fixed; see _DEMO_INPUTS
+    demo_inputs = dict(_DEMO_INPUTS)
 
     # Load policy
-    policy = load_policy(policy_path)
+    if policy is None:
+        policy = load_policy(policy_path)
 
     # === Step 1: Create task and run ===
     task_id = new_task_id()
@@ -69,7 +280,7 @@ def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str
 
     task = build_task(
         task_id=task_id,
-        objective=demo_objective,
+        objective=_DEMO_OBJECTIVE,
         domain="finance",
         created_at=started_at,
         inputs=demo_inputs,
@@ -84,8 +295,10 @@ def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str
     )
 
     # === Step 2: Create S1 step (formula selection) ===
-    s1_id = new_step_id()
-    s1_started = now_iso()
+    s1_id, s2_id = new_ids("step", 2)
+    # Steps start as soon as the previous stage ends, so their start times
+    # reuse the preceding timestamp
+    s1_started = started_at
 
     s1 = build_step(
         step_id=s1_id,
@@ -106,13 +319,10 @@ def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str
     s1_ended = now_iso()
 
     # Update S1 with execution results
-    s1["status"] = "EXECUTED"
-    s1["ended_at"] = s1_ended
-    s1["execution_output"] = s1_output
+    _mark_executed(s1, s1_ended, s1_output)
 
     # === Step 4: Create S2 step (payment calculation) ===
-    s2_id = new_step_id()
-    s2_started = now_iso()
+    s2_started = s1_ended
 
     s2 = build_step(
         step_id=s2_id,
@@ -151,22 +361,19 @@ def run_demo_task(policy_path: str = "policies/default_policy.json") -> dict[str
     )
 
     # Update S2 with execution results and evidence
-    s2["status"] = "EXECUTED"
-    s2["ended_at"] = s2_ended
-    s2["execution_output"] = f"Calculated payment: {s2_result['payment_display']}"
-    s2["evidence"] = [evidence_e1]
+    _mark_executed(
+        s2,
+        s2_ended,
+        f"Calculated payment: {s2_result['payment_display']}",
+        evidence=[evidence_e1],
+    )
 
     # === Step 6: Verify S1 and S2 ===
     # Apply policy before verification
     apply_step_policy(policy, "finance", [s1, s2])
 
-    s1_verification = verify_step(s1)
-    s1["verification"] = s1_verification
-    s1["status"] = "VERIFIED"
-
-    s2_verification = verify_step(s2)
-    s2["verification"] = s2_verification
-    s2["status"] = "VERIFIED"
+    _mark_verified(s1, verify_step(s1))
+    _mark_verified(s2, verify_step(s2))
 
     # === Step 7: Finalize run ===
     ended_at = now_iso()
@@ -221,6 +428,9 @@ def run_paper_verification_task(
     policy_path: str = "policies/default_policy.json",
     enable_memory_writes: bool = True,
     parent_run_id: str | None = None,
+    document: Document | None = None,
+    background_memory_write: bool = False,
+    policy: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Run the paper verification task with optional memory integration.
@@ -241,6 +451,13 @@ def run_paper_verification_task(
         memory_path: Optional path to memory JSON file for persistence.
         enable_memory_writes: Whether to persist memory writes (default True).
         parent_run_id: ID of the original run if this is a replay.
+        document: Optional preloaded Document for document_path. When
+            omitted, the document is loaded through the process cache.
+        background_memory_write: Queue the memory writes on the memory
+            store's background writer instead of waiting for the disk.
+            Later memory reads in this process still see them.
+        policy: Optional already loaded policy. When given, policy_path
+            is not read.
 
     Returns:
         A complete RSL document dictionary ready for validation and output.
@@ -248,24 +465,11 @@ def run_paper_verification_task(
     Raises:
         FileNotFoundError: If the document file does not exist.
     """
-    import re
-    from pathlib import Path
-    from .evidence.sentence_retriever import retrieve_evidence
-    from .utils.ids import new_memory_id, new_revision_id
-    from .storage.memory_store import load_memory, append_memory
-    from .consistency.contradiction_detector import (
-        detect_numeric_contradictions,
-        extract_percent,
-    )
-    from .revision.revision_engine import rewrite_claim
-    from .accounting.ledger import AccountingLedger
-
     # Read document
-    doc_path = Path(document_path)
-    if not doc_path.exists():
-        raise FileNotFoundError(f"Document not found: {document_path}")
+    if document is None:
+        document = load_document(document_path)
 
-    document_text = doc_path.read_text(encoding="utf-8")
+    document_text = document.text
 
     # === Load prior memory if path provided ===
     prior_memory = []
@@ -273,10 +477,8 @@ def run_paper_verification_task(
         prior_memory = load_memory(memory_path)
 
     # Load policy
-    policy = load_policy(policy_path)
-
-    # Load policy
-    policy = load_policy(policy_path)
+    if policy is None:
+        policy = load_policy(policy_path)
     
     # Initialize Accounting Ledger
     ledger = AccountingLedger()
@@ -306,7 +508,7 @@ def run_paper_verification_task(
     )
 
     # === Step S1: Extract the primary claim ===
-    s1_id = new_step_id()
+    s1_id, s2_id, s3_id = new_ids("step", 3)
     s1_started = now_iso()
 
     s1 = build_step(
@@ -339,20 +541,18 @@ def run_paper_verification_task(
         ledger.add_cost(0.0, "fallback execution") # No cost for fallback
 
 
-    s1["status"] = "EXECUTED"
-    s1["ended_at"] = now_iso()
-    s1["execution_output"] = s1_output
-    s1["execution"] = {"executor_used": s1["executor"]["name"]}
+    s1_ended = now_iso()
+    _mark_executed(
+        s1, s1_ended, s1_output, executor_used=s1["executor"]["name"]
+    )
 
     # Verify S1
     apply_step_policy(policy, "research_verification", [s1])
-    s1_verification = verify_step(s1)
-    s1["verification"] = s1_verification
-    s1["status"] = "VERIFIED"
+    _mark_verified(s1, verify_step(s1))
 
     # === Step S2: Retrieve evidence snippets ===
-    s2_id = new_step_id()
-    s2_started = now_iso()
+    # Each phase starts at the clock read that ended the previous one
+    s2_started = s1_ended
 
     s2 = build_step(
         step_id=s2_id,
@@ -373,7 +573,8 @@ def run_paper_verification_task(
     # Execute S2
     s2_context = {
         "inputs": {"paragraph": paragraph},
-        "document_text": document_text
+        "document_text": document_text,
+        "document_sentences": document.sentences,
     }
     
     if s2["executor"]["name"] == "retriever_stub":
@@ -384,22 +585,34 @@ def run_paper_verification_task(
         ledger.add_risk(0.05, "retriever_stub execution")
     else:
         # Fallback to direct tool call if not routed to stub (should not happen in demo)
-        evidence_results = retrieve_evidence(paragraph, document_text, k=3)
+        evidence_results = retrieve_evidence(
+            paragraph, document_text, k=3, sentences=document.sentences
+        )
         s2_output = f"Retrieved {len(evidence_results)} evidence sentences"
         ledger.add_cost(0.3, "tool execution")
         ledger.add_risk(0.02, "tool execution")
 
     s2_ended = now_iso()
 
-    # Create evidence records for S2
+    # Create evidence records for S2, collecting the sentences S3 checks
+    # the claim against in the same pass
+    # IDs for the S2 records and the S3 records that mirror them are drawn
+    # in one batch
+    evidence_count = len(evidence_results)
+    evidence_ids = new_ids("evidence", 2 * evidence_count)
+    s2_evidence_ids = evidence_ids[:evidence_count]
+    s3_evidence_ids = evidence_ids[evidence_count:]
+
     s2_evidence = []
-    for idx, ev_result in enumerate(evidence_results):
-        ev_id = new_evidence_id()
+    evidence_sentences = []
+    for ev_id, ev_result in zip(s2_evidence_ids, evidence_results):
+        sentence = ev_result["content"]
+        evidence_sentences.append(sentence)
         evidence_item = build_evidence(
             evidence_id=ev_id,
             source="sentence_retriever",
             content={
-                "sentence": ev_result["content"],
+                "sentence": sentence,
                 "relevance_score": ev_result["relevance_score"],
                 "sentence_index": ev_result["sentence_index"],
             },
@@ -407,21 +620,17 @@ def run_paper_verification_task(
         )
         s2_evidence.append(evidence_item)
 
-    s2["status"] = "EXECUTED"
-    s2["ended_at"] = s2_ended
-    s2["execution_output"] = s2_output
-    s2["evidence"] = s2_evidence
-    s2["execution"] = {"executor_used": s2["executor"]["name"]}
+    _mark_executed(
+        s2, s2_ended, s2_output,
+        evidence=s2_evidence, executor_used=s2["executor"]["name"],
+    )
 
     # Verify S2
     apply_step_policy(policy, "research_verification", [s2])
-    s2_verification = verify_step(s2)
-    s2["verification"] = s2_verification
-    s2["status"] = "VERIFIED"
+    _mark_verified(s2, verify_step(s2))
 
     # === Step S3: Verify claim support ===
-    s3_id = new_step_id()
-    s3_started = now_iso()
+    s3_started = s2_ended
 
     s3 = build_step(
         step_id=s3_id,
@@ -442,8 +651,7 @@ def run_paper_verification_task(
     # Verify S3
     apply_step_policy(policy, "research_verification", [s3])
 
-    # Execute S3 - use the same evidence from S2
-    evidence_sentences = [ev["content"]["sentence"] for ev in s2_evidence]
+    # Execute S3 - use the same evidence sentences from S2
     claim = paragraph
 
     # Perform claim verification
@@ -454,51 +662,52 @@ def run_paper_verification_task(
     s3_ended = now_iso()
 
     # Create evidence records for S3 (reuse same sentences as S3's own evidence)
+    # Every record shares the one issues list verify_claim_support returned;
+    # the IDs S3's verification checks are collected in the same pass
     s3_evidence = []
-    for ev in s2_evidence:
-        # Create new evidence IDs for S3's evidence
-        ev_id = new_evidence_id()
+    s3_checked_evidence_ids = []
+    for ev_id, ev in zip(s3_evidence_ids, s2_evidence):
+        # S3's evidence gets its own IDs
+        ev_content = ev["content"]
         evidence_item = build_evidence(
             evidence_id=ev_id,
             source="claim_verification",
             content={
-                "sentence": ev["content"]["sentence"],
-                "relevance_score": ev["content"]["relevance_score"],
+                "sentence": ev_content["sentence"],
+                "relevance_score": ev_content["relevance_score"],
                 "verification_issues": issues,
             },
             created_at=s3_ended,
         )
         s3_evidence.append(evidence_item)
+        s3_checked_evidence_ids.append(ev_id)
 
-    s3["status"] = "EXECUTED"
-    s3["ended_at"] = s3_ended
-    
     if s3["executor"]["name"] == "o3_stub":
         # O3 stub returns analysis, but we still need verification status from rule verifier
         o3_output = o3_stub.execute(s3, {})
-        s3["execution_output"] = f"{o3_output} | Verification result: {verification_status}"
+        s3_output = f"{o3_output} | Verification result: {verification_status}"
         ledger.add_cost(2.0, "o3_stub execution")
         ledger.add_risk(0.1, "o3_stub execution")
     else:
-        s3["execution_output"] = f"Verification result: {verification_status}"
+        s3_output = f"Verification result: {verification_status}"
         ledger.add_cost(0.0, "verification execution")
-        
-    s3["evidence"] = s3_evidence
-    s3["execution"] = {"executor_used": s3["executor"]["name"]}
+
+    _mark_executed(
+        s3, s3_ended, s3_output,
+        evidence=s3_evidence, executor_used=s3["executor"]["name"],
+    )
     
     # Set base confidence from verification result
     ledger.set_base_confidence(verification_confidence)
 
     # Build S3 verification using the claim verification results
-    s3_checked_evidence_ids = [ev["evidence_id"] for ev in s3_evidence]
-    s3["verification"] = build_verification(
+    _mark_verified(s3, build_verification(
         result=verification_status,
         confidence=verification_confidence,
         checked_evidence_ids=s3_checked_evidence_ids,
-        verified_at=now_iso(),
+        verified_at=s3_ended,
         notes="; ".join(issues) if issues else "No issues detected",
-    )
-    s3["status"] = "VERIFIED"
+    ))
 
     # === Revision Logic ===
     revision_triggered = False
@@ -509,7 +718,7 @@ def run_paper_verification_task(
     
     if verification_status == "CONTRADICTED" and max_revisions > 0:
         # Attempt to rewrite claim
-        rewritten_claim = rewrite_claim(paragraph, evidence_sentences)
+        rewritten_claim = _rewrite_claim_cached(paragraph, tuple(evidence_sentences))
         
         if rewritten_claim != paragraph:
             revision_triggered = True
@@ -608,19 +817,7 @@ def run_paper_verification_task(
 
     # === Create final conclusion with readable format ===
     # Extract evidence percent and scope info from issues
-    evidence_percent = None
-    scope_info = None
-    claim_percent = extract_percent(paragraph) if memory_path else None
-
-    for issue in issues:
-        if "evidence shows" in issue:
-            match = re.search(r"evidence shows (\d+\.?\d*)%", issue)
-            if match:
-                evidence_percent = match.group(1)
-        if "Scope limitation" in issue:
-            match = re.search(r"'([^']+)'", issue)
-            if match:
-                scope_info = match.group(1)
+    evidence_percent, scope_info = _summarize_issues(issues)
 
     # Adjust confidence if contradictions detected
     # We now rely on the ledger for confidence adjustments
@@ -649,79 +846,18 @@ def run_paper_verification_task(
 
     # Build conclusion based on verification status and contradictions
     if revision_triggered:
-        conclusion_content = (
-            f"The original claim was revised after contradiction. "
-            f"The corrected claim states that {paragraph} "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif contradictions and verification_status == "WEAK":
-        # Primary reason is document contradiction, memory is secondary
-        prior_val = contradictions[0]["prior_value"]
-        curr_val = contradictions[0]["current_value"]
-        conclusion_content = (
-            f"The claim is CONTRADICTED by the document, which reports {evidence_percent or prior_val}% "
-            f"rather than {curr_val}%. "
-            f"This also conflicts with prior memory recorded from earlier verified runs. "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif contradictions:
-        # Has contradictions but not WEAK status
-        prior_val = contradictions[0]["prior_value"]
-        curr_val = contradictions[0]["current_value"]
-        conclusion_content = (
-            f"The claim is PARTIALLY SUPPORTED but conflicts with prior memory. "
-            f"The document reports {evidence_percent or prior_val}%, "
-            f"which differs from the claimed {curr_val}%. "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif verification_status == "SUPPORTED":
-        conclusion_content = (
-            f"The claim is SUPPORTED by the evidence. "
-            f"The document confirms the stated improvement. "
-            f"Confidence: {final_confidence:.2f}."
+        conclusion_content = _CONCLUSION_TEMPLATES["REVISED"].format(
+            claim=paragraph, confidence=final_confidence
         )
-    elif verification_status == "PARTIALLY_SUPPORTED":
-        if evidence_percent and scope_info:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence reports {evidence_percent}% {scope_info}, "
-                f"which is close to the claimed value but not identical "
-                f"and does not generalize beyond that scope. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        elif evidence_percent:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence reports {evidence_percent}%, "
-                f"which differs slightly from the claimed value. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        elif scope_info:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence is limited to {scope_info} "
-                f"and may not generalize beyond that scope. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        else:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"Some aspects of the claim could not be fully verified. "
-                f"Confidence: {final_confidence:.2f}."
-            )
     else:
-        conclusion_content = (
-            f"The claim has WEAK support. "
-            f"The evidence does not adequately support the stated claim. "
-            f"Confidence: {final_confidence:.2f}."
+        conclusion_content = _conclusion_content(
+            verification_status, contradictions, evidence_percent, scope_info,
+            final_confidence,
         )
 
     # Append contradiction notice if detected
     if contradictions:
-        conclusion_content += (
-            " WARNING: This claim conflicts with prior memory. "
-            f"A numeric discrepancy of {abs(contradictions[0]['current_value'] - contradictions[0]['prior_value']):.1f}% was detected."
-        )
+        conclusion_content += _contradiction_warning(contradictions)
 
     # Add CONTRADICTION memory write if contradictions detected
     if memory_path and contradictions:
@@ -732,7 +868,7 @@ def run_paper_verification_task(
                 "content": c["description"],
                 "confidence": 0.90,
                 "derived_from_step_ids": [s3_id],
-                "written_at": now_iso(),
+                "written_at": ended_at,
             }
             memory_writes.append(contradiction_memory)
 
@@ -755,74 +891,15 @@ def run_paper_verification_task(
     # Sync ledger with final conclusion if blocked
     if final_conclusion["confidence"] == 0.0 and ledger.final_confidence > 0.0:
         ledger.force_block()
-    elif contradictions and verification_status == "WEAK":
-        # Primary reason is document contradiction, memory is secondary
-        prior_val = contradictions[0]["prior_value"]
-        curr_val = contradictions[0]["current_value"]
-        conclusion_content = (
-            f"The claim is CONTRADICTED by the document, which reports {evidence_percent or prior_val}% "
-            f"rather than {curr_val}%. "
-            f"This also conflicts with prior memory recorded from earlier verified runs. "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif contradictions:
-        # Has contradictions but not WEAK status
-        prior_val = contradictions[0]["prior_value"]
-        curr_val = contradictions[0]["current_value"]
-        conclusion_content = (
-            f"The claim is PARTIALLY SUPPORTED but conflicts with prior memory. "
-            f"The document reports {evidence_percent or prior_val}%, "
-            f"which differs from the claimed {curr_val}%. "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif verification_status == "SUPPORTED":
-        conclusion_content = (
-            f"The claim is SUPPORTED by the evidence. "
-            f"The document confirms the stated improvement. "
-            f"Confidence: {final_confidence:.2f}."
-        )
-    elif verification_status == "PARTIALLY_SUPPORTED":
-        if evidence_percent and scope_info:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence reports {evidence_percent}% {scope_info}, "
-                f"which is close to the claimed value but not identical "
-                f"and does not generalize beyond that scope. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        elif evidence_percent:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence reports {evidence_percent}%, "
-                f"which differs slightly from the claimed value. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        elif scope_info:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"The evidence is limited to {scope_info} "
-                f"and may not generalize beyond that scope. "
-                f"Confidence: {final_confidence:.2f}."
-            )
-        else:
-            conclusion_content = (
-                f"The claim is PARTIALLY SUPPORTED. "
-                f"Some aspects of the claim could not be fully verified. "
-                f"Confidence: {final_confidence:.2f}."
-            )
     else:
-        conclusion_content = (
-            f"The claim has WEAK support. "
-            f"The evidence does not adequately support the stated claim. "
-            f"Confidence: {final_confidence:.2f}."
+        conclusion_content = _conclusion_content(
+            verification_status, contradictions, evidence_percent, scope_info,
+            final_confidence,
         )
 
     # Append contradiction notice if detected
     if contradictions:
-        conclusion_content += (
-            " WARNING: This claim conflicts with prior memory. "
-            f"A numeric discrepancy of {abs(contradictions[0]['current_value'] - contradictions[0]['prior_value']):.1f}% was detected."
-        )
+        conclusion_content += _contradiction_warning(contradictions)
 
     # Add CONTRADICTION memory write if contradictions detected
     if memory_path and contradictions:
@@ -833,7 +910,7 @@ def run_paper_verification_task(
                 "content": c["description"],
                 "confidence": 0.90,
                 "derived_from_step_ids": [s3_id],
-                "written_at": now_iso(),
+                "written_at": ended_at,
             }
             memory_writes.append(contradiction_memory)
 
@@ -845,15 +922,15 @@ def run_paper_verification_task(
         finalized_at=ended_at,
     )
 
-    # Re-apply policy to catch any revision violations
-    apply_step_policy(policy, "research_verification", [s1, s2, s3])
-
-    # Enforce finalization policy
+    # Steps are unchanged since policy was re-applied above, so only the
+    # finalization policy is enforced again
     final_conclusion = enforce_finalization_policy(
         policy, "research_verification", final_conclusion, [s1, s2, s3]
     )
 
     # === Build audit logs ===
+    # Events reuse the timestamps already taken when they happened rather
+    # than reading the clock again while the log is assembled
     audit_logs = [
         {
             "event": "EVIDENCE_RETRIEVED",
@@ -877,7 +954,7 @@ def run_paper_verification_task(
     if revision_triggered:
         audit_logs.append({
             "event": "REVISION_TRIGGERED",
-            "timestamp": now_iso(),
+            "timestamp": revised_at,
             "details": {
                 "step_id": s1_id,
                 "reason": "Original claim contradicted by evidence",
@@ -887,7 +964,7 @@ def run_paper_verification_task(
     if contradictions:
         audit_logs.append({
             "event": "CONTRADICTION_DETECTED",
-            "timestamp": now_iso(),
+            "timestamp": contradictions[0]["detected_at"],
             "details": {
                 "count": len(contradictions),
                 "severity": "HIGH",
@@ -899,10 +976,11 @@ def run_paper_verification_task(
     if memory_writes:
         audit_logs.append({
             "event": "MEMORY_WRITTEN",
-            "timestamp": now_iso(),
+            "timestamp": ended_at,
             "details": {
                 "count": len(memory_writes),
-                "types": list(set(m["type"] for m in memory_writes)),
+                # Distinct types in first-written order
+                "types": list(dict.fromkeys(m["type"] for m in memory_writes)),
             },
         })
 
@@ -918,9 +996,6 @@ def run_paper_verification_task(
         audit["replay_of"] = parent_run_id
         
     # Compute run hash
-    import hashlib
-    import json
-    
     hash_content = {
         "task_inputs": task["inputs"],
         "steps_output": [s["execution_output"] for s in [s1, s2, s3]],
@@ -929,8 +1004,7 @@ def run_paper_verification_task(
     }
     
     # Sort keys for deterministic JSON serialization
-    hash_str = json.dumps(hash_content, sort_keys=True)
-    audit["run_hash"] = hashlib.sha256(hash_str.encode("utf-8")).hexdigest()
+    audit["run_hash"] = hashlib.sha256(canonical_json_bytes(hash_content)).hexdigest()
 
     rsl_document = {
         "rsl_version": RSL_VERSION,
@@ -946,8 +1020,70 @@ def run_paper_verification_task(
 
     # === Persist memory writes ===
     if memory_path and memory_writes and enable_memory_writes:
-        append_memory(memory_path, memory_writes)
+        if background_memory_write:
+            append_memory_background(memory_path, memory_writes)
+        else:
+            append_memory(memory_path, memory_writes)
 
     return rsl_document
 
 
+async def run_paper_verification_task_async(
+    paragraph: str,
+    document_path: str,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Run run_paper_verification_task in a worker thread.
+
+    The pipeline itself stays synchronous, since S2 depends on S1 and S3 on
+    both; running it off the event loop lets document I/O and executor work
+    of independent tasks overlap.
+
+    Args:
+        paragraph: The paragraph containing the claim to verify.
+        document_path: Path to the document file.
+        **kwargs: Forwarded to run_paper_verification_task.
+
+    Returns:
+        A complete RSL document dictionary ready for validation and output.
+    """
+    # asyncio is imported here so synchronous callers never pay for it
+    import asyncio
+
+    return await asyncio.to_thread(
+        run_paper_verification_task, paragraph, document_path, **kwargs
+    )
+
+
+async def run_paper_verification_batch(
+    items: Iterable[tuple[str, str]],
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """
+    Verify several (paragraph, document_path) pairs concurrently.
+
+    The distinct documents are read concurrently up front and each task
+    gets its preloaded Document. Tasks sharing a memory_path should not be
+    batched, as each reads prior memory before the others have written
+    theirs.
+
+    Args:
+        items: (paragraph, document_path) pairs.
+        **kwargs: Forwarded to every run_paper_verification_task call.
+
+    Returns:
+        One RSL document per item, in input order.
+    """
+    import asyncio
+
+    items = list(items)
+    documents = await asyncio.to_thread(
+        load_documents, [document_path for _, document_path in items]
+    )
+    return list(await asyncio.gather(*(
+        run_paper_verification_task_async(
+            paragraph, document_path, document=document, **kwargs
+        )
+        for (paragraph, document_path), document in zip(items, documents)
+    )))
@@ -1,6 +1,100 @@
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, FrozenSet, Mapping, NamedTuple, Optional, Tuple
 
-def apply_step_policy(policy: Dict[str, Any], domain: str, steps: List[Dict[str, Any]]) -> None:
+
+class PolicyView(NamedTuple):
+    """The policy settings for one domain, read out of the policy once."""
+
+    evidence_required_indices: FrozenSet[int]
+    evidence_required_ids: FrozenSet[str]
+    max_revisions: int
+    contradiction_penalty: float
+    revision_penalty: float
+    fail_closed: bool
+    min_confidence: float
+    global_block_threshold: float
+    block_message: str
+    model_executor: str
+    step_executor_overrides: Dict[str, str]
+
+    @classmethod
+    def from_policy(cls, policy: Mapping[str, Any], domain: str) -> "PolicyView":
+        """
+        Builds the view of a policy for a domain.
+        
+        Args:
+            policy: The loaded policy dictionary.
+            domain: The domain of the task.
+            
+        Returns:
+            The PolicyView with the policy's defaults filled in.
+        """
+        domain_defaults = policy.get("domain_defaults", {}).get(domain, {})
+        global_rules = policy.get("global_rules", {})
+        evidence_required_steps = domain_defaults.get("evidence_required_steps", [])
+        # "S<number>" identifiers name the step at index number - 1; every
+        # identifier may also match a step_id literally
+        evidence_required_indices = frozenset(
+            int(identifier[1:]) - 1
+            for identifier in evidence_required_steps
+            if identifier.startswith("S") and identifier[1:].isdigit()
+        )
+        routing = policy.get("routing", {})
+        # A domain override replaces the default model executor; step
+        # overrides are applied on top of it by the router
+        model_executor = routing.get("domain_overrides", {}).get(
+            domain, routing.get("default_model_executor", "gpt_stub")
+        )
+        return cls(
+            evidence_required_indices=evidence_required_indices,
+            evidence_required_ids=frozenset(evidence_required_steps),
+            max_revisions=domain_defaults.get("max_revisions_per_step", 100), # Default high if not set
+            contradiction_penalty=domain_defaults.get("contradiction_penalty", 0.0),
+            revision_penalty=domain_defaults.get("revision_penalty", 0.0),
+            fail_closed=domain_defaults.get("fail_closed_if_unverified", False),
+            min_confidence=domain_defaults.get("min_confidence_to_finalize", 0.0),
+            global_block_threshold=global_rules.get("block_if_confidence_below", 0.0),
+            block_message=global_rules.get("block_message", "Output blocked by policy."),
+            model_executor=model_executor,
+            step_executor_overrides=dict(routing.get("step_overrides", {})),
+        )
+
+
+# Views of the read-only policies returned by load_policy, keyed by
+# (id(policy), domain). Those policies cannot change, so their views never
+# go stale; each entry keeps its policy alive so the id cannot be reused
+# while cached. Plain dict policies may be modified by their owner and are
+# not cached.
+_views: Dict[Tuple[int, str], Tuple[Mapping[str, Any], PolicyView]] = {}
+_MAX_VIEWS = 64
+
+def get_policy_view(policy: Mapping[str, Any], domain: str) -> PolicyView:
+    """
+    Returns the PolicyView for a policy and domain.
+    
+    Views of policies returned by load_policy are built on first use and
+    cached; views of plain dict policies are built on every call.
+    
+    Args:
+        policy: The loaded policy dictionary.
+        domain: The domain of the task.
+        
+    Returns:
+        The PolicyView.
+    """
+    key = (id(policy), domain)
+    entry = _views.get(key)
+    if entry is not None and entry[0] is policy:
+        return entry[1]
+    
+    view = PolicyView.from_policy(policy, domain)
+    if isinstance(policy, MappingProxyType):
+        if len(_views) >= _MAX_VIEWS:
+            _views.clear()
+        _views[key] = (policy, view)
+    return view
+
+def apply_step_policy(policy: Mapping[str, Any], domain: str, steps: List[Dict[str, Any]]) -> None:
     """
     Applies policy rules to a list of steps.
     
@@ -12,9 +106,10 @@ def apply_step_policy(policy: Dict[str, Any], domain: str, steps: List[Dict[str,
         domain: The domain of the task (e.g., "research_verification").
         steps: List of step dictionaries.
     """
-    domain_defaults = policy.get("domain_defaults", {}).get(domain, {})
-    evidence_required_steps = domain_defaults.get("evidence_required_steps", [])
-    max_revisions = domain_defaults.get("max_revisions_per_step", 100) # Default high if not set
+    view = get_policy_view(policy, domain)
+    evidence_required_indices = view.evidence_required_indices
+    evidence_required_ids = view.evidence_required_ids
+    max_revisions = view.max_revisions
 
     for step in steps:
         # Enforce evidence required
@@ -37,26 +132,13 @@ def apply_step_policy(policy: Dict[str, Any], domain: str, steps: List[Dict[str,
         # Also, the prompt says "step_ids or step titles".
         # If I can't match by ID (since they are random UUIDs), I should try to match by index if the string is "S<number>".
         
-        # Let's implement a helper to check if a step matches the policy identifier.
+        # The identifiers are parsed once into the PolicyView.
         
         step_index = step.get("step_index")
         step_id = step.get("step_id")
         
-        should_require_evidence = False
-        
-        for identifier in evidence_required_steps:
-            # Check if identifier is "S<number>"
-            if identifier.startswith("S") and identifier[1:].isdigit():
-                target_index = int(identifier[1:]) - 1
-                if step_index == target_index:
-                    should_require_evidence = True
-                    break
-            # Check if identifier matches step_id (unlikely for dynamic IDs but possible)
-            if identifier == step_id:
-                should_require_evidence = True
-                break
-        
-        if should_require_evidence:
+        # Match by "S<number>" index, or by step_id (unlikely for dynamic IDs but possible)
+        if step_index in evidence_required_indices or step_id in evidence_required_ids:
             step["evidence_required"] = True
             
         # Enforce max revisions
@@ -77,7 +159,7 @@ def apply_step_policy(policy: Dict[str, Any], domain: str, steps: List[Dict[str,
 
 
 def compute_final_confidence(
-    policy: Dict[str, Any],
+    policy: Mapping[str, Any],
     domain: str,
     base_confidence: float,
     had_contradiction: bool,
@@ -96,23 +178,21 @@ def compute_final_confidence(
     Returns:
         The adjusted confidence score (0.0 to 1.0).
     """
-    domain_defaults = policy.get("domain_defaults", {}).get(domain, {})
-    contradiction_penalty = domain_defaults.get("contradiction_penalty", 0.0)
-    revision_penalty = domain_defaults.get("revision_penalty", 0.0)
+    view = get_policy_view(policy, domain)
     
     confidence = base_confidence
     
     if had_contradiction:
-        confidence -= contradiction_penalty
+        confidence -= view.contradiction_penalty
         
     if had_revision:
-        confidence -= revision_penalty
+        confidence -= view.revision_penalty
         
     return max(0.0, min(1.0, confidence))
 
 
 def enforce_finalization_policy(
-    policy: Dict[str, Any],
+    policy: Mapping[str, Any],
     domain: str,
     final_conclusion: Dict[str, Any],
     steps: List[Dict[str, Any]]
@@ -129,13 +209,12 @@ def enforce_finalization_policy(
     Returns:
         The potentially modified final conclusion dictionary.
     """
-    domain_defaults = policy.get("domain_defaults", {}).get(domain, {})
-    global_rules = policy.get("global_rules", {})
+    view = get_policy_view(policy, domain)
     
-    fail_closed = domain_defaults.get("fail_closed_if_unverified", False)
-    min_confidence = domain_defaults.get("min_confidence_to_finalize", 0.0)
-    global_block_threshold = global_rules.get("block_if_confidence_below", 0.0)
-    block_message = global_rules.get("block_message", "Output blocked by policy.")
+    fail_closed = view.fail_closed
+    min_confidence = view.min_confidence
+    global_block_threshold = view.global_block_threshold
+    block_message = view.block_message
     
     should_block = False
     block_reason = ""
@@ -1,30 +1,61 @@
-import json
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
-def load_policy(path: str) -> Dict[str, Any]:
+from ..utils.json_bytes import loads_bytes
+
+def load_policy(path: str) -> Mapping[str, Any]:
     """
     Loads a policy JSON file from the given path.
     
+    Parsed policies are cached per process and reused until the file on
+    disk changes. The returned policy is shared between callers and is
+    read-only: objects are MappingProxyType and arrays are tuples, so
+    attempts to modify it raise TypeError or AttributeError.
+    
     Args:
         path: Path to the policy JSON file.
         
     Returns:
-        The loaded policy as a dictionary.
+        The loaded policy as a read-only mapping.
         
     Raises:
         FileNotFoundError: If the file does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
         ValueError: If the policy shape is invalid.
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Policy file not found at: {path}")
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Policy file not found at: {path}") from None
         
-    with open(path, 'r') as f:
-        policy = json.load(f)
+    return _load_policy_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=32)
+def _load_policy_cached(abs_path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    # mtime_ns and size are part of the cache key so edits invalidate entries;
+    # invalid policies raise and are therefore never cached
+    with open(abs_path, 'rb') as f:
+        policy = loads_bytes(f.read())
         
     validate_policy_shape(policy)
-    return policy
+    return _freeze(policy)
+
+def _freeze(value: Any) -> Any:
+    # Read-only copy of a decoded JSON value: objects become MappingProxyType
+    # and arrays tuples, so a cached policy cannot be changed by any caller
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def clear_policy_cache() -> None:
+    """
+    Drops all cached policies so the next load_policy call rereads the file.
+    """
+    _load_policy_cached.cache_clear()
 
 def validate_policy_shape(policy: Dict[str, Any]) -> None:
     """
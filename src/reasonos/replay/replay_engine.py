@@ -1,14 +1,33 @@
-import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-from ..kernel import run_paper_verification_task
-from ..utils.time import now_iso
+from ..utils.json_bytes import dump_pretty, loads_bytes
+from ..utils.time import compact_utc_stamp
 
-def replay_run(original_run_path: str, save_to_disk: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+ReplayResult = Tuple[Dict[str, Any], Dict[str, Any]]
+
+# Replays in progress, keyed by (absolute run path, save_to_disk)
+_inflight: Dict[Tuple[str, bool], "Future[ReplayResult]"] = {}
+_inflight_lock = threading.Lock()
+
+# We assume the policy used was the default or we'd need to store policy path in run artifact.
+# For this step, we'll assume default_policy.json as per constraints.
+_DEFAULT_POLICY_PATH = "policies/default_policy.json"
+
+def replay_run(original_run_path: str, save_to_disk: bool = True) -> ReplayResult:
     """
     Replay a past run deterministically.
     
+    Concurrent calls for the same run file and save_to_disk setting share
+    one replay: the first caller runs it and the others wait for and
+    receive the same result (or exception), so the kernel runs and the
+    replay file is written once.
+    
     Args:
         original_run_path: Path to the original run JSON file.
         save_to_disk: Whether to save the replayed run to disk (default True).
@@ -20,12 +39,44 @@ def replay_run(original_run_path: str, save_to_disk: bool = True) -> Tuple[Dict[
         FileNotFoundError: If original run file doesn't exist.
         ValueError: If run type is not supported.
     """
+    key = (os.path.abspath(original_run_path), save_to_disk)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            # Imported here to keep importing this module cheap
+            from concurrent.futures import Future
+
+            future = Future()
+            _inflight[key] = future
+            
+    if not is_leader:
+        return future.result()
+        
+    try:
+        result = _replay_run(original_run_path, save_to_disk)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _replay_run(original_run_path: str, save_to_disk: bool) -> ReplayResult:
+    # Imported here so tools that only read or save replay files do not
+    # load the kernel
+    from ..kernel import run_paper_verification_task
+    
     run_path = Path(original_run_path)
     if not run_path.exists():
         raise FileNotFoundError(f"Run file not found: {original_run_path}")
         
-    with open(run_path, "r") as f:
-        original_run = json.load(f)
+    with open(run_path, "rb") as f:
+        original_run = loads_bytes(f.read())
         
     task = original_run.get("task", {})
     domain = task.get("domain")
@@ -38,28 +89,40 @@ def replay_run(original_run_path: str, save_to_disk: bool = True) -> Tuple[Dict[
     paragraph = inputs.get("paragraph")
     document_path = inputs.get("document_path")
     
-    # We assume the policy used was the default or we'd need to store policy path in run artifact.
-    # For this step, we'll assume default_policy.json as per constraints.
-    policy_path = "policies/default_policy.json"
-    
     # Re-execute
     # Note: We need to modify kernel to accept enable_memory_writes and parent_run_id
     replayed_run = run_paper_verification_task(
         paragraph=paragraph,
         document_path=document_path,
-        policy_path=policy_path,
+        policy_path=_DEFAULT_POLICY_PATH,
         memory_path=None, # Disable memory loading/writing for replay to ensure isolation
         enable_memory_writes=False, # Explicit flag we will add to kernel
         parent_run_id=original_run["run"]["run_id"] # Link to original
     )
     
     if save_to_disk:
-        # Save replay run
-        timestamp = now_iso().replace(":", "").replace("-", "").split(".")[0]
-        replay_filename = run_path.stem + f"_replay_{timestamp}.json"
-        replay_path = run_path.parent / replay_filename
-        
-        with open(replay_path, "w") as f:
-            json.dump(replayed_run, f, indent=2)
+        save_replay_run(original_run_path, replayed_run)
         
     return original_run, replayed_run
+
+
+def save_replay_run(original_run_path: str, replayed_run: Dict[str, Any]) -> Path:
+    """
+    Save a replayed run next to the original run file.
+    
+    Args:
+        original_run_path: Path to the original run JSON file.
+        replayed_run: The replayed run dictionary to save.
+        
+    Returns:
+        Path of the written replay file.
+    """
+    run_path = Path(original_run_path)
+    timestamp = compact_utc_stamp()
+    replay_filename = run_path.stem + f"_replay_{timestamp}.json"
+    replay_path = run_path.parent / replay_filename
+    
+    with open(replay_path, "wb") as f:
+        dump_pretty(replayed_run, f)
+        
+    return replay_path
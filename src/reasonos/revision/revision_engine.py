@@ -5,6 +5,12 @@ Provides deterministic claim rewriting based on verified evidence.
 
 import re
 
+# Matches patterns like "15 percent", "14.8 percent", "15%"
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:percent|%)", re.IGNORECASE)
+
+# Scope limiters like "in the indoor setting"
+_SCOPE_RE = re.compile(r"(in the [a-z]+ setting)", re.IGNORECASE)
+
 
 def rewrite_claim(claim: str, evidence_texts: list[str]) -> str:
     """
@@ -30,13 +36,13 @@ def rewrite_claim(claim: str, evidence_texts: list[str]) -> str:
     primary_evidence = evidence_texts[0]
 
     # Extract percent
-    percent_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:percent|%)", primary_evidence, re.IGNORECASE)
+    percent_match = _PERCENT_RE.search(primary_evidence)
     percent_val = percent_match.group(1) if percent_match else None
 
     # Extract scope
     # Look for "in the ... setting" or similar scope limiters
     # For this demo, we specifically look for "in the indoor setting" as per requirements
-    scope_match = re.search(r"(in the [a-z]+ setting)", primary_evidence, re.IGNORECASE)
+    scope_match = _SCOPE_RE.search(primary_evidence)
     scope_val = scope_match.group(1) if scope_match else None
 
     # If we found a percent, we can rewrite
@@ -49,7 +55,7 @@ def rewrite_claim(claim: str, evidence_texts: list[str]) -> str:
         # Replace the percent value in the original claim, add "approximately", and append scope
         
         # 1. Find the original percent in claim to replace
-        claim_percent_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:percent|%)", claim, re.IGNORECASE)
+        claim_percent_match = _PERCENT_RE.search(claim)
         
         if claim_percent_match:
             # Construct new claim parts
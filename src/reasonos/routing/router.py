@@ -1,6 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
-def route_executor(policy: Dict[str, Any], domain: str, step: Dict[str, Any]) -> Dict[str, Any]:
+from ..policy.policy_engine import get_policy_view
+
+# Logical step IDs (S1, S2, ...) for the step indexes runs actually use
+_LOGICAL_IDS = tuple(f"S{i + 1}" for i in range(256))
+
+def route_executor(policy: Mapping[str, Any], domain: str, step: Dict[str, Any]) -> Dict[str, Any]:
     """
     Determine the executor for a step based on policy routing rules.
     
@@ -32,26 +37,20 @@ def route_executor(policy: Dict[str, Any], domain: str, step: Dict[str, Any]) ->
         if current_executor.get("type") == "TOOL":
             return current_executor
 
-    # Routing configuration
-    routing = policy.get("routing", {})
-    step_overrides = routing.get("step_overrides", {})
-    domain_overrides = routing.get("domain_overrides", {})
-    default_executor = routing.get("default_model_executor", "gpt_stub")
+    # Routing configuration, with the domain override (3) already applied
+    # over the default (4)
+    view = get_policy_view(policy, domain)
     
     # Determine logical step ID (e.g., S1, S2)
     # We assume S{index+1} mapping as established in Step 7
     step_index = step.get("step_index", 0)
-    logical_id = f"S{step_index + 1}"
+    if 0 <= step_index < len(_LOGICAL_IDS):
+        logical_id = _LOGICAL_IDS[step_index]
+    else:
+        logical_id = f"S{step_index + 1}"
     
-    executor_name = default_executor
-    
-    # 3. Domain override
-    if domain in domain_overrides:
-        executor_name = domain_overrides[domain]
-        
     # 2. Step override (higher priority)
-    if logical_id in step_overrides:
-        executor_name = step_overrides[logical_id]
+    executor_name = view.step_executor_overrides.get(logical_id, view.model_executor)
         
     return {
         "type": "MODEL",
@@ -59,7 +58,7 @@ def route_executor(policy: Dict[str, Any], domain: str, step: Dict[str, Any]) ->
         "config": {}
     }
 
-def resolve_and_attach_executor(policy: Dict[str, Any], domain: str, step: Dict[str, Any]) -> None:
+def resolve_and_attach_executor(policy: Mapping[str, Any], domain: str, step: Dict[str, Any]) -> None:
     """
     Resolve the executor for the step and attach the spec to the step.
     
@@ -2,9 +2,80 @@
 
 Pure functions that build dictionaries for each RSL entity.
 These functions do not perform I/O; they only assemble data.
+
+The builders return plain dicts so documents validate and serialize as
+is; the TypedDicts below only describe their shape for type checkers.
 """
 
-from typing import Any
+from typing import Any, TypedDict
+
+
+class Task(TypedDict):
+    """Shape of a task dictionary."""
+
+    task_id: str
+    objective: str
+    domain: str
+    created_at: str
+    inputs: dict[str, Any]
+
+
+class _RunRequired(TypedDict):
+    run_id: str
+    status: str
+    started_at: str
+    ended_at: str | None
+
+
+class Run(_RunRequired, total=False):
+    """Shape of a run dictionary."""
+
+    model_policy: dict[str, Any]
+    tool_policy: dict[str, Any]
+
+
+class Evidence(TypedDict):
+    """Shape of an evidence dictionary."""
+
+    evidence_id: str
+    source: str
+    content: dict[str, Any]
+    created_at: str
+
+
+class _VerificationRequired(TypedDict):
+    result: str
+    confidence: float
+    checked_evidence_ids: list[str]
+    verified_at: str
+
+
+class Verification(_VerificationRequired, total=False):
+    """Shape of a verification dictionary."""
+
+    notes: str
+
+
+class _StepRequired(TypedDict):
+    step_id: str
+    step_index: int
+    action: str
+    status: str
+    started_at: str
+    ended_at: str
+    depends_on: list[str]
+    executor: str | dict[str, Any]
+    evidence_required: bool
+    evidence: list[Evidence]
+
+
+class Step(_StepRequired, total=False):
+    """Shape of a step dictionary, including fields set after building."""
+
+    execution_output: str
+    verification: Verification
+    execution: dict[str, Any]
+    revisions: list[dict[str, Any]]
 
 
 def build_task(
@@ -13,7 +84,7 @@ def build_task(
     domain: str,
     created_at: str,
     inputs: dict[str, Any],
-) -> dict[str, Any]:
+) -> Task:
     """Build a task dictionary."""
     return {
         "task_id": task_id,
@@ -31,9 +102,9 @@ def build_run(
     ended_at: str | None = None,
     model_policy: dict[str, Any] | None = None,
     tool_policy: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> Run:
     """Build a run dictionary."""
-    run = {
+    run: Run = {
         "run_id": run_id,
         "status": status,
         "started_at": started_at,
@@ -54,14 +125,14 @@ def build_step(
     started_at: str,
     ended_at: str,
     depends_on: list[str],
-    executor: str,
+    executor: str | dict[str, Any],
     evidence_required: bool,
-    evidence: list[dict[str, Any]],
+    evidence: list[Evidence],
     execution_output: str | None = None,
-    verification: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+    verification: Verification | None = None,
+) -> Step:
     """Build a step dictionary."""
-    step = {
+    step: Step = {
         "step_id": step_id,
         "step_index": step_index,
         "action": action,
@@ -85,7 +156,7 @@ def build_evidence(
     source: str,
     content: dict[str, Any],
     created_at: str,
-) -> dict[str, Any]:
+) -> Evidence:
     """Build an evidence dictionary."""
     return {
         "evidence_id": evidence_id,
@@ -101,9 +172,9 @@ def build_verification(
     checked_evidence_ids: list[str],
     verified_at: str,
     notes: str | None = None,
-) -> dict[str, Any]:
+) -> Verification:
     """Build a verification dictionary."""
-    verification = {
+    verification: Verification = {
         "result": result,
         "confidence": confidence,
         "checked_evidence_ids": checked_evidence_ids,
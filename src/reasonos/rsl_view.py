@@ -0,0 +1,121 @@
+"""Typed read-only views over RSL documents.
+
+RSL documents stay plain dictionaries for building, validation and
+serialization. These views give callers that only read a finished
+document attribute access to the commonly inspected fields, with the
+missing-field defaults resolved once up front.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutorView:
+    """Executor assignment of a step."""
+
+    type: str
+    name: str
+    used: str
+
+
+@dataclass(slots=True, frozen=True)
+class StepView:
+    """The identifying and routing fields of a step."""
+
+    step_id: str | None
+    step_index: int | None
+    executor: ExecutorView
+
+
+@dataclass(slots=True, frozen=True)
+class ConfidenceAdjustmentView:
+    """A single accounting confidence adjustment."""
+
+    source: str
+    delta: float
+    reason: str
+
+
+@dataclass(slots=True, frozen=True)
+class AccountingView:
+    """The accounting snapshot of a run."""
+
+    total_cost: float | None
+    total_risk: float | None
+    base_confidence: float | None
+    final_confidence: float | None
+    confidence_adjustments: tuple[ConfidenceAdjustmentView, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class RSLView:
+    """Read-only view of an RSL document."""
+
+    steps: tuple[StepView, ...]
+    accounting: AccountingView | None
+    conclusion_content: str
+    conclusion_confidence: float | None
+
+
+def _step_view(step: dict[str, Any]) -> StepView:
+    executor = step.get("executor", {})
+    execution = step.get("execution", {})
+    if isinstance(executor, str):
+        # Unrouted steps carry a bare executor kind such as "tool" or
+        # "model"; the router treats "tool" as type TOOL the same way
+        executor_type = executor.upper()
+        executor_name = executor
+    else:
+        executor_type = executor.get("type", "unknown")
+        executor_name = executor.get("name", "unknown")
+    return StepView(
+        step_id=step.get("step_id"),
+        step_index=step.get("step_index"),
+        executor=ExecutorView(
+            type=executor_type,
+            name=executor_name,
+            used=execution.get("executor_used", "unknown"),
+        ),
+    )
+
+
+def _accounting_view(accounting: dict[str, Any]) -> AccountingView | None:
+    if not accounting:
+        return None
+    return AccountingView(
+        total_cost=accounting.get("total_cost"),
+        total_risk=accounting.get("total_risk"),
+        base_confidence=accounting.get("base_confidence"),
+        final_confidence=accounting.get("final_confidence"),
+        confidence_adjustments=tuple(
+            ConfidenceAdjustmentView(
+                source=adj["source"],
+                delta=adj["delta"],
+                reason=adj.get("reason", ""),
+            )
+            for adj in accounting.get("confidence_adjustments", [])
+        ),
+    )
+
+
+def typed_view(rsl: dict[str, Any]) -> RSLView:
+    """
+    Build a typed read-only view of an RSL document.
+
+    The view is a snapshot; later changes to the dictionary are not
+    reflected in it.
+
+    Args:
+        rsl: The RSL document dictionary.
+
+    Returns:
+        An RSLView over the document's steps, accounting and conclusion.
+    """
+    conclusion = rsl.get("final_conclusion", {})
+    return RSLView(
+        steps=tuple(_step_view(step) for step in rsl.get("steps", [])),
+        accounting=_accounting_view(rsl.get("accounting", {})),
+        conclusion_content=conclusion.get("content", ""),
+        conclusion_confidence=conclusion.get("confidence"),
+    )
@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 import json
 from pathlib import Path
 
 from ..kernel import run_paper_verification_task, run_demo_task
+from ..policy.policy_loader import load_policy
+from ..utils.doc_cache import Document
 from ..replay.replay_engine import replay_run
 
 class ReasonOSClient:
@@ -30,12 +32,31 @@ class ReasonOSClient:
         self.policy_path = policy_path
         self.memory_path = memory_path
         self.enable_replay = enable_replay
+        self._policy: Optional[Mapping[str, Any]] = None
+
+    @property
+    def policy(self) -> Mapping[str, Any]:
+        """
+        The client's policy, loaded from policy_path on first use.
+        
+        The parsed policy is kept for the lifetime of the client, so later
+        calls neither stat nor read the policy file. Edits to the file are
+        not picked up; create a new client to reload it.
+        
+        Raises:
+            FileNotFoundError: If the policy file does not exist.
+            ValueError: If the policy shape is invalid.
+        """
+        if self._policy is None:
+            self._policy = load_policy(self.policy_path)
+        return self._policy
 
     def verify_research_claim(
         self,
         claim: str,
         document_path: str,
-        domain: str = "research_verification"
+        domain: str = "research_verification",
+        document: Optional[Document] = None
     ) -> Dict[str, Any]:
         """
         Verify a research claim against a document.
@@ -44,6 +65,7 @@ class ReasonOSClient:
             claim: The claim text to verify.
             document_path: Path to the source document.
             domain: The domain of the task (default: "research_verification").
+            document: Optional preloaded Document for document_path.
             
         Returns:
             A dictionary containing the full RSL (Reasoning System Log) run artifact.
@@ -56,7 +78,9 @@ class ReasonOSClient:
             document_path=document_path,
             memory_path=self.memory_path,
             policy_path=self.policy_path,
-            enable_memory_writes=bool(self.memory_path)
+            policy=self.policy,
+            enable_memory_writes=bool(self.memory_path),
+            document=document
         )
 
     def run_tool_reasoning(
@@ -88,7 +112,7 @@ class ReasonOSClient:
         # The existing logic is in run_demo_task.
         # Let's check kernel.py again.
         
-        return run_demo_task(policy_path=self.policy_path)
+        return run_demo_task(policy_path=self.policy_path, policy=self.policy)
 
     def replay_run(
         self,
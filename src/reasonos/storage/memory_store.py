@@ -1,11 +1,46 @@
 """Disk-backed memory store for ReasonOS.
 
-Provides persistent storage for memory writes across runs.
+Provides persistent storage for memory writes across runs. Memory files
+hold one JSON object per line (JSON Lines), so appends only write the
+new records. Files in the older single-JSON-array format are still read
+and are rewritten as JSON Lines on the first append.
+
+Callers that run several tasks against the same file can wrap them in
+open_memory_session() so the file is read once and written once.
+Callers that should not wait for the disk can use
+append_memory_background(); later reads in the same process wait for
+the pending write first.
 """
 
+import atexit
 import json
+import os
+import secrets
+import stat
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from ..utils.json_bytes import dumps_bytes, loads_bytes
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+
+# In-process write-back buffers for open memory sessions, keyed by path
+_sessions: dict[str, list[dict[str, Any]]] = {}
+
+# Single background writer, so queued appends reach each file in order,
+# and every write queued for each path that nobody has waited for yet
+_writer: "ThreadPoolExecutor | None" = None
+_writer_lock = threading.Lock()
+_pending: dict[str, list["Future[None]"]] = {}
+_pending_lock = threading.Lock()
+
+
+def _session_key(memory_path: str) -> str:
+    return str(Path(memory_path).resolve())
 
 
 class MemoryStoreError(Exception):
@@ -14,44 +49,166 @@ class MemoryStoreError(Exception):
     pass
 
 
+def _wait_for_pending(key: str) -> None:
+    # Waits for every queued write to the path and surfaces the first
+    # failure to the caller; writes queued meanwhile stay pending
+    with _pending_lock:
+        futures = list(_pending.get(key, ()))
+    if not futures:
+        return
+
+    first_error: BaseException | None = None
+    for future in futures:
+        error = future.exception()
+        if error is not None and first_error is None:
+            first_error = error
+
+    with _pending_lock:
+        remaining = [f for f in _pending.get(key, ()) if f not in futures]
+        if remaining:
+            _pending[key] = remaining
+        else:
+            _pending.pop(key, None)
+
+    if first_error is not None:
+        raise first_error
+
+
+def _get_writer() -> "ThreadPoolExecutor":
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            # Imported here so processes that never write in the background
+            # skip the pool setup
+            from concurrent.futures import ThreadPoolExecutor
+
+            _writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="memory-writer"
+            )
+            atexit.register(_writer.shutdown, wait=True)
+        return _writer
+
+
 def load_memory(memory_path: str) -> list[dict[str, Any]]:
     """
-    Load memory from a JSON file.
+    Load memory from a memory file.
 
     Args:
-        memory_path: Path to the memory JSON file.
+        memory_path: Path to the memory file.
 
     Returns:
         List of memory write dictionaries. Returns empty list if file
         does not exist or is empty.
 
     Raises:
-        MemoryStoreError: If JSON parsing fails.
+        MemoryStoreError: If JSON parsing fails or a line is not a JSON
+            object.
     """
+    key = _session_key(memory_path)
+    session = _sessions.get(key)
+    if session is not None:
+        return list(session)
+
+    _wait_for_pending(key)
+    return _read_memory_file(memory_path)
+
+
+def _read_memory_file(memory_path: str) -> list[dict[str, Any]]:
     path = Path(memory_path)
 
     if not path.exists():
         return []
 
     try:
-        content = path.read_text(encoding="utf-8").strip()
+        content = path.read_bytes().strip()
         if not content:
             return []
 
-        data = json.loads(content)
-
-        if not isinstance(data, list):
-            raise MemoryStoreError(
-                f"Memory file must contain a JSON array: {memory_path}"
-            )
-
-        return data
+        if content.startswith(b"["):
+            # Legacy format: the whole file is one JSON array
+            data = loads_bytes(content)
+            if not isinstance(data, list):
+                raise MemoryStoreError(
+                    f"Memory file must contain a JSON array: {memory_path}"
+                )
+            for item in data:
+                if not isinstance(item, dict):
+                    raise MemoryStoreError(
+                        f"Memory file array must contain JSON objects: {memory_path}"
+                    )
+            return data
+
+        items = [loads_bytes(line) for line in content.splitlines() if line.strip()]
 
     except json.JSONDecodeError as e:
         raise MemoryStoreError(
             f"Invalid JSON in memory file {memory_path}: {e}"
         ) from e
 
+    for item in items:
+        if not isinstance(item, dict):
+            raise MemoryStoreError(
+                f"Memory file lines must contain JSON objects: {memory_path}"
+            )
+
+    return items
+
+
+def iter_memory(memory_path: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream memory writes from a memory file one record at a time.
+
+    Unlike load_memory, the file is parsed line by line as the caller
+    consumes records, so callers that stop early never read the rest.
+    Files in the legacy JSON array format are loaded whole. Inside an
+    open_memory_session the session buffer is streamed instead.
+
+    Args:
+        memory_path: Path to the memory file.
+
+    Yields:
+        Memory write dictionaries in file order.
+
+    Raises:
+        MemoryStoreError: If JSON parsing fails or a line is not a JSON
+            object.
+    """
+    key = _session_key(memory_path)
+    session = _sessions.get(key)
+    if session is not None:
+        yield from list(session)
+        return
+
+    _wait_for_pending(key)
+    path = Path(memory_path)
+    if not path.exists():
+        return
+
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(b"["):
+                # Legacy format: the whole file is one JSON array
+                yield from _read_memory_file(memory_path)
+                return
+            try:
+                item = loads_bytes(line)
+            except json.JSONDecodeError as e:
+                raise MemoryStoreError(
+                    f"Invalid JSON in memory file {memory_path}: {e}"
+                ) from e
+            if not isinstance(item, dict):
+                raise MemoryStoreError(
+                    f"Memory file lines must contain JSON objects: {memory_path}"
+                )
+            yield item
+
+
+def _encode_lines(items: list[dict[str, Any]]) -> bytes:
+    return b"".join(dumps_bytes(item) + b"\n" for item in items)
+
 
 def append_memory(memory_path: str, writes: list[dict[str, Any]]) -> None:
     """
@@ -60,7 +217,7 @@ def append_memory(memory_path: str, writes: list[dict[str, Any]]) -> None:
     Creates parent directories and the file if they do not exist.
 
     Args:
-        memory_path: Path to the memory JSON file.
+        memory_path: Path to the memory file.
         writes: List of memory write dictionaries to append.
 
     Raises:
@@ -69,36 +226,211 @@ def append_memory(memory_path: str, writes: list[dict[str, Any]]) -> None:
     if not writes:
         return
 
+    key = _session_key(memory_path)
+    session = _sessions.get(key)
+    if session is not None:
+        session.extend(writes)
+        return
+
+    _wait_for_pending(key)
+    _append_to_file(memory_path, writes)
+
+
+def _migrate_array_to_jsonl(path: Path) -> None:
+    """
+    Rewrite a legacy JSON array memory file as JSON Lines, once.
+
+    Args:
+        path: Memory file path.
+
+    Raises:
+        MemoryStoreError: If the file cannot be read, parsed or written.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(64).lstrip()
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        raise MemoryStoreError(f"Failed to read memory file {path}: {e}") from e
+
+    if head.startswith(b"["):
+        _write_atomic(path, _read_memory_file(str(path)))
+
+
+def _append_to_file(memory_path: str, writes: list[dict[str, Any]]) -> None:
     path = Path(memory_path)
 
     # Create parent directories if needed
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Load existing memory
-    existing = load_memory(memory_path)
+    _migrate_array_to_jsonl(path)
 
-    # Append new writes
-    updated = existing + writes
-
-    # Write back with stable formatting
+    # Append only the new records, one JSON object per line
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(updated, f, indent=2)
+        with open(path, "ab") as f:
+            f.write(_encode_lines(writes))
     except OSError as e:
         raise MemoryStoreError(
             f"Failed to write memory file {memory_path}: {e}"
         ) from e
 
 
+def append_memory_background(
+    memory_path: str, writes: list[dict[str, Any]]
+) -> "Future[None] | None":
+    """
+    Queue memory writes to be appended on a background thread.
+
+    Appends run one at a time in submission order. load_memory,
+    append_memory and clear_memory for the same path wait for all queued
+    writes first, and pending writes are flushed at interpreter exit.
+    Inside an open_memory_session the writes go to the session buffer
+    immediately instead.
+
+    Args:
+        memory_path: Path to the memory file.
+        writes: List of memory write dictionaries to append.
+
+    Returns:
+        A future that resolves once the writes are on disk, or None if
+        nothing was queued. Its result() raises MemoryStoreError if the
+        write failed.
+    """
+    if not writes:
+        return None
+
+    key = _session_key(memory_path)
+    session = _sessions.get(key)
+    if session is not None:
+        session.extend(writes)
+        return None
+
+    future = _get_writer().submit(_append_to_file, memory_path, list(writes))
+    with _pending_lock:
+        _pending.setdefault(key, []).append(future)
+    return future
+
+
+def flush_memory_writes() -> None:
+    """
+    Wait for every queued background memory write to finish.
+
+    All paths are waited for even if one of them failed.
+
+    Raises:
+        MemoryStoreError: If a queued write failed; the first failure is
+            raised.
+    """
+    with _pending_lock:
+        keys = list(_pending)
+
+    first_error: BaseException | None = None
+    for key in keys:
+        try:
+            _wait_for_pending(key)
+        except BaseException as e:
+            if first_error is None:
+                first_error = e
+
+    if first_error is not None:
+        raise first_error
+
+
+def _write_atomic(path: Path, items: list[dict[str, Any]]) -> None:
+    """
+    Replace the memory file with items via a synced temp file and rename.
+
+    The replaced file keeps its permission bits; a new file gets the
+    usual mode for the process umask.
+
+    Args:
+        path: Destination memory file path.
+        items: Full list of memory write dictionaries to store.
+
+    Raises:
+        MemoryStoreError: If file operations fail.
+    """
+    data = _encode_lines(items)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}")
+        # Created with 0o666 so the umask applies as for any new file
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        raise MemoryStoreError(
+            f"Failed to write memory file {path}: {e}"
+        ) from e
+
+
+@contextmanager
+def open_memory_session(memory_path: str) -> Iterator[list[dict[str, Any]]]:
+    """
+    Buffer all memory reads and writes for a path until the session ends.
+
+    The file is loaded once on entry. While the session is open,
+    load_memory and append_memory for the same path operate on the
+    in-memory buffer, and the buffer is written back once on exit using
+    an atomic temp-file rename. If the block raises, the buffered changes
+    are discarded and the file is left as it was.
+
+    Args:
+        memory_path: Path to the memory file.
+
+    Yields:
+        The live buffer of memory write dictionaries.
+
+    Raises:
+        MemoryStoreError: If loading or the final write fails.
+    """
+    key = _session_key(memory_path)
+    if key in _sessions:
+        # Nested session on the same path shares the outer buffer
+        yield _sessions[key]
+        return
+
+    buffer = load_memory(memory_path)
+    _sessions[key] = buffer
+    try:
+        yield buffer
+    except BaseException:
+        del _sessions[key]
+        raise
+    else:
+        del _sessions[key]
+        _write_atomic(Path(memory_path), buffer)
+
+
 def query_memory(
-    memory_items: list[dict[str, Any]],
+    memory_items: Iterable[dict[str, Any]],
     predicate: Callable[[dict[str, Any]], bool],
 ) -> list[dict[str, Any]]:
     """
     Filter memory items using a predicate function.
 
+    memory_items may be a loaded list or the iter_memory stream. To stop
+    after the first k matches, use
+    itertools.islice(filter(predicate, iter_memory(path)), k) instead.
+
     Args:
-        memory_items: List of memory write dictionaries.
+        memory_items: Memory write dictionaries, as a list or iterable.
         predicate: Function that returns True for items to include.
 
     Returns:
@@ -112,8 +444,15 @@ def clear_memory(memory_path: str) -> None:
     Clear all memory from the file.
 
     Args:
-        memory_path: Path to the memory JSON file.
+        memory_path: Path to the memory file.
     """
+    key = _session_key(memory_path)
+    session = _sessions.get(key)
+    if session is not None:
+        session.clear()
+        return
+
+    _wait_for_pending(key)
     path = Path(memory_path)
     if path.exists():
-        path.write_text("[]", encoding="utf-8")
+        path.write_bytes(b"")
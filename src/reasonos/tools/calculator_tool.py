@@ -1,10 +1,40 @@
 """Calculator tool for loan payment calculations."""
 
-from typing import Any
+import math
+from functools import lru_cache
+from typing import Any, Iterable
 
 from ..utils.ids import new_event_id
 
 
+@lru_cache(maxsize=4096)
+def _growth_minus_one(monthly_rate: float, months: int) -> float:
+    # (1 + i)^n - 1, computed without cancellation for small rates; loan
+    # tables repeat the same rate and term many times
+    return math.expm1(months * math.log1p(monthly_rate))
+
+
+def _rounded_payment(principal: float, annual_rate: float, months: int) -> float:
+    if principal <= 0:
+        raise ValueError("Principal must be positive")
+    if annual_rate < 0:
+        raise ValueError("Annual rate cannot be negative")
+    if months <= 0:
+        raise ValueError("Months must be positive")
+
+    monthly_rate = annual_rate / 12
+
+    if monthly_rate == 0:
+        # Handle zero interest rate case
+        payment = principal / months
+    else:
+        # Standard amortization formula
+        growth = _growth_minus_one(monthly_rate, months)
+        payment = principal * monthly_rate * (growth + 1) / growth
+
+    return round(payment, 2)
+
+
 def calculate_amortized_payment(
     principal: float,
     annual_rate: float,
@@ -32,27 +62,38 @@ def calculate_amortized_payment(
             - monthly_payment_value: The calculated payment as a float
             - monthly_payment_display: The payment formatted for display
     """
-    if principal <= 0:
-        raise ValueError("Principal must be positive")
-    if annual_rate < 0:
-        raise ValueError("Annual rate cannot be negative")
-    if months <= 0:
-        raise ValueError("Months must be positive")
-
-    monthly_rate = annual_rate / 12
-
-    if monthly_rate == 0:
-        # Handle zero interest rate case
-        payment = principal / months
-    else:
-        # Standard amortization formula
-        factor = (1 + monthly_rate) ** months
-        payment = principal * monthly_rate * factor / (factor - 1)
-
-    payment_rounded = round(payment, 2)
+    payment_rounded = _rounded_payment(principal, annual_rate, months)
 
     return {
         "tool_call_id": new_event_id(),
         "monthly_payment_value": payment_rounded,
         "monthly_payment_display": f"${payment_rounded:.2f}",
     }
+
+
+def calculate_amortized_payment_batch(
+    loans: Iterable[tuple[float, float, int]],
+) -> list[float]:
+    """
+    Calculate rounded monthly payments for many loans at once.
+
+    Uses the same formula, validation and rounding as
+    calculate_amortized_payment, but returns bare payment values and
+    does not allocate a tool call ID per loan. Repeated rate and term
+    pairs share the cached growth factor.
+
+    Args:
+        loans: (principal, annual_rate, months) tuples.
+
+    Returns:
+        The monthly payment for each loan, rounded to cents, in input
+        order.
+
+    Raises:
+        ValueError: If any loan has a non-positive principal or term, or
+            a negative rate.
+    """
+    return [
+        _rounded_payment(principal, annual_rate, months)
+        for principal, annual_rate, months in loans
+    ]
@@ -0,0 +1,26 @@
+"""Canonical JSON encoding for ReasonOS hashing.
+
+Run hashes are computed over these bytes, so the encoding must never
+change: it is exactly json.dumps(obj, sort_keys=True) with the standard
+library's default separators and ASCII escaping, the form every saved
+run_hash was produced with. The standard library json module is the
+only encoder used here, so hashes do not depend on optional packages.
+"""
+
+import json
+from typing import Any
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """
+    Encode an object as canonical JSON bytes for hashing.
+
+    Hashes are only comparable when every producer uses this function.
+
+    Args:
+        obj: The JSON-serializable object to encode.
+
+    Returns:
+        The UTF-8 encoded canonical JSON representation.
+    """
+    return json.dumps(obj, sort_keys=True).encode("utf-8")
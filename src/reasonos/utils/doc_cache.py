@@ -0,0 +1,83 @@
+"""Process-wide cache of source documents for ReasonOS.
+
+Documents are read and split into sentences once per process and reused
+until the file on disk changes.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from .text import split_sentences
+
+
+class Document(NamedTuple):
+    """A loaded source document with its pre-split sentences."""
+
+    path: str
+    text: str
+    sentences: tuple[str, ...]
+
+
+@lru_cache(maxsize=32)
+def _read_document(resolved_path: str, mtime_ns: int, size: int) -> Document:
+    # mtime_ns and size are part of the cache key so edits invalidate entries
+    text = Path(resolved_path).read_text(encoding="utf-8")
+    return Document(
+        path=resolved_path,
+        text=text,
+        sentences=tuple(split_sentences(text)),
+    )
+
+
+def load_document(document_path: str) -> Document:
+    """
+    Load a document, reusing the cached copy if the file is unchanged.
+
+    Args:
+        document_path: Path to the document file.
+
+    Returns:
+        The cached Document for the file's current contents.
+
+    Raises:
+        FileNotFoundError: If the document file does not exist.
+    """
+    path = Path(document_path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {document_path}") from None
+
+    return _read_document(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def load_documents(document_paths: Iterable[str], max_workers: int = 8) -> list[Document]:
+    """
+    Load several documents, reading the distinct files concurrently.
+
+    Each distinct path is loaded once, so tasks that share a document do
+    not race to read it into the cache.
+
+    Args:
+        document_paths: Paths to the document files.
+        max_workers: Maximum number of concurrent reads.
+
+    Returns:
+        One Document per input path, in input order.
+
+    Raises:
+        FileNotFoundError: If any document file does not exist.
+    """
+    paths = list(document_paths)
+    distinct = list(dict.fromkeys(paths))
+    if len(distinct) <= 1:
+        loaded = [load_document(path) for path in distinct]
+    else:
+        # Imported here to keep single-document loads free of the pool setup
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(distinct))) as pool:
+            loaded = list(pool.map(load_document, distinct))
+    by_path = dict(zip(distinct, loaded))
+    return [by_path[path] for path in paths]
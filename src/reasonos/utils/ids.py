@@ -1,45 +1,80 @@
-"""ID generation utilities for ReasonOS entities."""
+"""ID generation utilities for ReasonOS entities.
 
-from uuid import uuid4
+IDs are a kind prefix followed by 12 random hex characters (48 bits).
+"""
+
+import os
+
+# ID prefix for each kind accepted by new_ids
+_PREFIXES = {
+    "task": "task_",
+    "run": "run_",
+    "step": "step_",
+    "evidence": "ev_",
+    "event": "evt_",
+    "memory": "mem_",
+    "contradiction": "ctr_",
+    "revision": "rev_",
+}
 
 
 def new_task_id() -> str:
     """Generate a new unique task ID."""
-    return f"task_{uuid4().hex[:12]}"
+    return "task_" + os.urandom(6).hex()
 
 
 def new_run_id() -> str:
     """Generate a new unique run ID."""
-    return f"run_{uuid4().hex[:12]}"
+    return "run_" + os.urandom(6).hex()
 
 
 def new_step_id() -> str:
     """Generate a new unique step ID."""
-    return f"step_{uuid4().hex[:12]}"
+    return "step_" + os.urandom(6).hex()
 
 
 def new_evidence_id() -> str:
     """Generate a new unique evidence ID."""
-    return f"ev_{uuid4().hex[:12]}"
+    return "ev_" + os.urandom(6).hex()
 
 
 def new_event_id() -> str:
     """Generate a new unique event ID."""
-    return f"evt_{uuid4().hex[:12]}"
+    return "evt_" + os.urandom(6).hex()
 
 
 def new_memory_id() -> str:
     """Generate a new unique memory ID."""
-    return f"mem_{uuid4().hex[:12]}"
+    return "mem_" + os.urandom(6).hex()
 
 
 def new_contradiction_id() -> str:
     """Generate a new unique contradiction ID."""
-    return f"ctr_{uuid4().hex[:12]}"
+    return "ctr_" + os.urandom(6).hex()
 
 
 def new_revision_id() -> str:
     """Generate a new unique revision ID."""
-    return f"rev_{uuid4().hex[:12]}"
+    return "rev_" + os.urandom(6).hex()
+
+
+def new_ids(kind: str, n: int) -> list[str]:
+    """
+    Generate n unique IDs of one kind from a single entropy read.
+
+    The IDs have the same prefix and 12 hex character suffix as the
+    matching new_*_id helper.
+
+    Args:
+        kind: Entity kind, e.g. "step" or "evidence".
+        n: Number of IDs to generate.
 
+    Returns:
+        A list of n IDs.
 
+    Raises:
+        KeyError: If kind is not a known entity kind.
+    """
+    prefix = _PREFIXES[kind]
+    hex_digits = os.urandom(6 * n).hex()
+    return [prefix + hex_digits[i:i + 12] for i in range(0, 12 * n, 12)]
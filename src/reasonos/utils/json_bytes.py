@@ -0,0 +1,68 @@
+"""JSON encoding and decoding for ReasonOS documents and artifacts.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON bytes.
+
+    Key order is preserved, unlike canonical_json_bytes, so the output
+    matches the document as built.
+
+    Args:
+        obj: The JSON-serializable object to encode.
+
+    Returns:
+        The UTF-8 encoded JSON representation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dump_pretty(obj: Any, out: BinaryIO) -> None:
+    """
+    Write an object to a binary stream as JSON indented by two spaces.
+
+    Without orjson the document is encoded and written chunk by chunk,
+    so the full indented text is never held in memory at once.
+
+    Args:
+        obj: The JSON-serializable object to encode.
+        out: Binary stream to write to, e.g. a file opened with "wb".
+    """
+    if orjson is not None:
+        out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+        out.write(chunk.encode("utf-8"))
+
+
+def loads_bytes(data: bytes | str) -> Any:
+    """
+    Decode JSON from bytes or a string.
+
+    Args:
+        data: The JSON text, as UTF-8 bytes or str.
+
+    Returns:
+        The decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON. orjson's
+            decode error subclasses it, so callers catch one type.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
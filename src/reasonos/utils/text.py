@@ -1,6 +1,12 @@
 """Text processing utilities for ReasonOS."""
 
 import re
+from functools import lru_cache
+
+# Compiled once at import; these run for every sentence of every document
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+_PERCENT_VALUE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:percent|%)", re.IGNORECASE)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
 
 
 def normalize_whitespace(text: str) -> str:
@@ -16,7 +22,9 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Text with normalized whitespace.
     """
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() with no separator splits on exactly the characters \s
+    # matches, so this equals re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def split_sentences(text: str) -> list[str]:
@@ -33,8 +41,7 @@ def split_sentences(text: str) -> list[str]:
         A list of sentence strings, each stripped of leading/trailing whitespace.
     """
     # Split on sentence-ending punctuation followed by space or end
-    pattern = r"(?<=[.!?])\s+"
-    sentences = re.split(pattern, text)
+    sentences = _SENTENCE_BOUNDARY_RE.split(text)
 
     # Clean up and filter empty strings
     result = []
@@ -46,11 +53,14 @@ def split_sentences(text: str) -> list[str]:
     return result
 
 
+@lru_cache(maxsize=1024)
 def extract_percent_value(text: str) -> float | None:
     """
     Extract the first percentage value from text.
 
-    Matches patterns like "15 percent", "14.8 percent", "15%".
+    Matches patterns like "15 percent", "14.8 percent", "15%". Results
+    are cached, since verification and replays rescan the same evidence
+    sentences.
 
     Args:
         text: The text to search for percentage values.
@@ -59,8 +69,7 @@ def extract_percent_value(text: str) -> float | None:
         The numeric value as a float, or None if no match found.
     """
     # Match number followed by "percent" or "%"
-    pattern = r"(\d+(?:\.\d+)?)\s*(?:percent|%)"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _PERCENT_VALUE_RE.search(text)
     if match:
         return float(match.group(1))
     return None
@@ -79,5 +88,5 @@ def tokenize(text: str) -> list[str]:
         A list of lowercase word tokens.
     """
     # Remove punctuation and split
-    cleaned = re.sub(r"[^\w\s]", " ", text.lower())
+    cleaned = _NON_WORD_RE.sub(" ", text.lower())
     return cleaned.split()
@@ -1,8 +1,30 @@
 """Time utilities for ReasonOS."""
 
-from datetime import datetime, timezone
+import time
+
+# (epoch second, formatted string) of the last now_iso() call. Timestamps
+# have one-second resolution, so calls within the same second reuse it.
+_last_iso: tuple[int, str] = (-1, "")
 
 
 def now_iso() -> str:
     """Return current UTC time as ISO 8601 string ending in Z."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    global _last_iso
+    second = int(time.time())
+    last = _last_iso
+    if last[0] != second:
+        t = time.gmtime(second)
+        last = (
+            second,
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z",
+        )
+        # Replaced as one tuple so concurrent callers never see a
+        # second paired with another second's string
+        _last_iso = last
+    return last[1]
+
+
+def compact_utc_stamp() -> str:
+    """Return current UTC time as a compact filename stamp (YYYYMMDDTHHMMSSZ)."""
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
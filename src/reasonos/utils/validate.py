@@ -1,36 +1,86 @@
 """RSL document validation utilities."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from jsonschema import Draft202012Validator, ValidationError
 
+from .json_bytes import loads_bytes
 
-def validate_rsl(doc: dict[str, Any], schema_path: str) -> None:
+
+def _schema_key(schema_path: str) -> tuple[str, int, int]:
     """
-    Validate an RSL document against the JSON Schema.
+    Identify the current version of a schema file for the caches below.
 
     Args:
-        doc: The RSL document dictionary to validate.
         schema_path: Path to the JSON Schema file.
 
+    Returns:
+        The resolved path, modification time and size of the file, so
+        edited schemas are loaded again.
+
     Raises:
         FileNotFoundError: If the schema file does not exist.
-        ValidationError: If the document does not conform to the schema.
-        ValueError: If the schema file cannot be parsed.
     """
     path = Path(schema_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
 
+@lru_cache(maxsize=8)
+def _load_schema(resolved_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Load and parse a JSON Schema file once per file version.
+
+    Args:
+        resolved_path: Resolved path to the JSON Schema file.
+        mtime_ns: Modification time of the file, part of the cache key.
+        size: Size of the file, part of the cache key.
+
+    Returns:
+        The parsed schema dictionary.
+
+    Raises:
+        ValueError: If the schema file cannot be parsed.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            schema = json.load(f)
+        return loads_bytes(Path(resolved_path).read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in schema file: {e}") from e
 
-    validator = Draft202012Validator(schema)
+
+@lru_cache(maxsize=8)
+def _get_validator(resolved_path: str, mtime_ns: int, size: int) -> Draft202012Validator:
+    """Check and build the jsonschema validator once per file version."""
+    schema = _load_schema(resolved_path, mtime_ns, size)
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
+def validate_rsl(doc: dict[str, Any], schema_path: str) -> None:
+    """
+    Validate an RSL document against the JSON Schema.
+
+    Validators are cached per schema file and rebuilt when the
+    file changes, so repeated calls only pay for a stat and the
+    validation walk itself.
+
+    Args:
+        doc: The RSL document dictionary to validate.
+        schema_path: Path to the JSON Schema file.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist.
+        ValidationError: If the document does not conform to the schema.
+        ValueError: If the schema file cannot be parsed.
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    validator = _get_validator(*_schema_key(schema_path))
     errors = list(validator.iter_errors(doc))
 
     if errors:
@@ -0,0 +1,22 @@
+"""Shared pytest setup for the ReasonOS tests.
+
+Puts the repository's src directory on sys.path, as the demo scripts do,
+and provides the repository paths the tests need.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture
+def default_policy_path() -> str:
+    """Absolute path of the default policy, independent of the working directory."""
+    return str(REPO_ROOT / "policies" / "default_policy.json")
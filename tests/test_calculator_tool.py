@@ -0,0 +1,43 @@
+import pytest
+
+from reasonos.tools.calculator_tool import (
+    calculate_amortized_payment,
+    calculate_amortized_payment_batch,
+)
+
+
+@pytest.mark.parametrize(
+    ("principal", "annual_rate", "months", "expected"),
+    [
+        # The demo task's loan
+        (10000, 0.05, 36, 299.71),
+        # 30 year mortgage at 6 percent
+        (200000, 0.06, 360, 1199.10),
+        # Zero interest is split evenly across the term
+        (12000, 0.0, 12, 1000.00),
+        (1000, 0.0, 3, 333.33),
+    ],
+)
+def test_known_payments(principal, annual_rate, months, expected):
+    result = calculate_amortized_payment(principal, annual_rate, months)
+
+    assert result["monthly_payment_value"] == expected
+    assert result["monthly_payment_display"] == f"${expected:.2f}"
+
+
+def test_batch_matches_single_calls():
+    loans = [(10000, 0.05, 36), (200000, 0.06, 360), (12000, 0.0, 12)]
+
+    assert calculate_amortized_payment_batch(loans) == [
+        calculate_amortized_payment(*loan)["monthly_payment_value"]
+        for loan in loans
+    ]
+
+
+@pytest.mark.parametrize(
+    ("principal", "annual_rate", "months"),
+    [(0, 0.05, 36), (10000, -0.01, 36), (10000, 0.05, 0)],
+)
+def test_invalid_loans_are_rejected(principal, annual_rate, months):
+    with pytest.raises(ValueError):
+        calculate_amortized_payment(principal, annual_rate, months)
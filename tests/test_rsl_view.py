@@ -0,0 +1,34 @@
+from reasonos.kernel import run_demo_task
+from reasonos.rsl_view import typed_view
+
+
+def test_typed_view_of_demo_task(default_policy_path):
+    rsl = run_demo_task(default_policy_path)
+
+    view = typed_view(rsl)
+
+    assert [step.step_index for step in view.steps] == [0, 1]
+    # Demo steps keep the bare executor strings from build_step
+    assert [step.executor.type for step in view.steps] == ["MODEL", "TOOL"]
+    assert [step.executor.name for step in view.steps] == ["model", "tool"]
+    assert view.accounting is None
+    assert view.conclusion_content == rsl["final_conclusion"]["content"]
+
+
+def test_typed_view_of_routed_step():
+    rsl = {
+        "steps": [
+            {
+                "step_id": "s1",
+                "step_index": 0,
+                "executor": {"type": "MODEL", "name": "gpt_stub", "config": {}},
+                "execution": {"executor_used": "gpt_stub"},
+            }
+        ],
+    }
+
+    (step,) = typed_view(rsl).steps
+
+    assert step.executor.type == "MODEL"
+    assert step.executor.name == "gpt_stub"
+    assert step.executor.used == "gpt_stub"
@@ -0,0 +1,46 @@
+import pytest
+
+from reasonos.evidence.sentence_retriever import retrieve_evidence
+from reasonos.utils.text import split_sentences, tokenize
+
+PARAGRAPH = "Model X improves accuracy by 15 percent on Dataset Y."
+DOCUMENT = (
+    "We evaluate Model X on Dataset Y. "
+    "Model X improves accuracy by 12 percent. "
+    "Training took three days. "
+    "The baseline model reaches lower accuracy on Dataset Y. "
+    "Results on other datasets are left for future work."
+)
+
+
+def _full_ranking(paragraph, document_text):
+    # Reference ranking: score every sentence and sort, as the retriever
+    # did before it switched to a partial top-k selection
+    query_tokens = set(tokenize(paragraph))
+    ranked = []
+    for idx, sentence in enumerate(split_sentences(document_text)):
+        overlap = len(query_tokens & set(tokenize(sentence)))
+        ranked.append((-overlap, idx, sentence, overlap))
+    ranked.sort()
+    return [
+        {
+            "content": sentence,
+            "relevance_score": round(overlap / max(1, len(query_tokens)), 3),
+            "sentence_index": idx,
+        }
+        for _, idx, sentence, overlap in ranked
+    ]
+
+
+@pytest.mark.parametrize("k", range(-7, 8))
+def test_matches_full_ranking_slice(k):
+    expected = _full_ranking(PARAGRAPH, DOCUMENT)[:k]
+
+    assert retrieve_evidence(PARAGRAPH, DOCUMENT, k=k) == expected
+
+
+def test_negative_k_drops_the_lowest_ranked():
+    results = retrieve_evidence(PARAGRAPH, DOCUMENT, k=-1)
+
+    assert len(results) == len(split_sentences(DOCUMENT)) - 1
+    assert results == retrieve_evidence(PARAGRAPH, DOCUMENT, k=len(results))